@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark the import footprint of APPER Solaire PV Dimmer platforms.
+
+Each scenario is imported several times in a fresh interpreter (once the Home Assistant entity
+platform helper is imported) and the minimum and median import times are reported (with the number
+of loaded modules):
+- all: all platforms, as forwarded before only needed platforms were set up
+- needed: platforms needed without state entities (select and switch are skipped)
+- scapy: the MAC address lookup dependency (now only imported when a MAC address is resolved)
+
+By default, the Home Assistant entity components imported by the platforms are measured, so the
+benchmark could run anywhere Home Assistant is installed. With --integration, the integration
+platform modules themselves are imported (run it from the configuration directory of the
+development container: cd /config && python /root/bin/benchmark_imports.py --integration).
+"""
+
+import argparse
+import json
+import statistics
+import subprocess  # nosec B404
+import sys
+
+PLATFORMS = ("binary_sensor", "button", "number", "select", "sensor", "switch", "text", "time")
+STATE_PLATFORMS = ("select", "switch")
+
+SCRIPT = """
+import json, sys, time
+import homeassistant.helpers.entity_platform
+loaded = len(sys.modules)
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    __import__(module)
+print(json.dumps({"duration": time.perf_counter() - start, "modules": len(sys.modules) - loaded}))
+"""
+
+
+def measure(modules: list[str], runs: int) -> tuple[float, float, int]:
+    """Return minimum and median import durations (in ms) and the number of loaded modules."""
+    durations, loaded = [], 0
+    for _ in range(runs):
+        # Run the current interpreter with a fixed script (no untrusted input)
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-c", SCRIPT, *modules], check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        durations.append(result["duration"] * 1000)
+        loaded = result["modules"]
+    return min(durations), statistics.median(durations), loaded
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--integration", action="store_true", help="import integration platforms")
+    parser.add_argument("--runs", type=int, default=30, help="number of runs of each scenario")
+    args = parser.parse_args()
+
+    prefix = (
+        "custom_components.appersolaire_pvdimmer"
+        if args.integration
+        else "homeassistant.components"
+    )
+    scenarios = {
+        "all": [f"{prefix}.{platform}" for platform in PLATFORMS],
+        "needed": [
+            f"{prefix}.{platform}" for platform in PLATFORMS if platform not in STATE_PLATFORMS
+        ],
+        "scapy": ["scapy.layers.l2"],
+    }
+    for name, modules in scenarios.items():
+        minimum, median, loaded = measure(modules, args.runs)
+        print(f"{name}: min {minimum:.1f}ms, median {median:.1f}ms ({loaded} modules)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import logging
+import shutil
+import time
+from functools import partial
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
+from . import capabilities, energy, long_term_statistics
+from .const import ARCHIVE_DIRECTORY, CONF_INCLUDE_STATE_ENTITIES, DOMAIN
 from .coordinator import PVDimmerDataUpdateCoordinator
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket_api
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -19,18 +33,64 @@ PLATFORMS: list[Platform] = [
     Platform.TIME,
 ]
 
+# Platforms only providing state entities
+STATE_PLATFORMS = {Platform.SELECT, Platform.SWITCH}
+
+# Platform -> data sections of its entities (if all of them are unsupported, the platform is not
+# needed)
+PLATFORMS_SECTIONS = {
+    Platform.TIME: ("dimmer_timer", "relay1_timer", "relay2_timer"),
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_platforms(entry: ConfigEntry[PVDimmerDataUpdateCoordinator]) -> list[Platform]:
+    """
+    Return platforms needed by a config entry.
+
+    Platforms only providing state entities are not needed if state entities are not included,
+    nor those providing only entities of unsupported data sections.
+    """
+    coordinator = entry.runtime_data
+    return [
+        platform
+        for platform in PLATFORMS
+        if (platform not in STATE_PLATFORMS or coordinator.get_option(CONF_INCLUDE_STATE_ENTITIES))
+        and (
+            platform not in PLATFORMS_SECTIONS
+            or any(coordinator.capabilities.supports(s) for s in PLATFORMS_SECTIONS[platform])
+        )
+    ]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up APPER Solaire PV Dimmer integration."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry[PVDimmerDataUpdateCoordinator]
 ) -> bool:
     """Set up APPER Solaire PV Dimmer from a config entry."""
+    start = time.monotonic()
     coordinator = PVDimmerDataUpdateCoordinator(hass, entry)
     entry.async_on_unload(entry.add_update_listener(coordinator.update_configuration))
     await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Keep forwarded platforms to unload them
+    coordinator.platforms = get_platforms(entry)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
+    _LOGGER.debug(
+        "%s set up in %.3fs (platforms: %s)",
+        entry.title,
+        time.monotonic() - start,
+        ", ".join(coordinator.platforms),
+    )
     return True
 
 
@@ -38,4 +98,17 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: ConfigEntry[PVDimmerDataUpdateCoordinator]
 ) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(entry, entry.runtime_data.platforms)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data of a config entry (stores and telemetry archive)."""
+    for module in (capabilities, energy, long_term_statistics):
+        await Store(
+            hass, module.STORAGE_VERSION, module.STORAGE_KEY.format(entry_id=entry.entry_id)
+        ).async_remove()
+    await hass.async_add_executor_job(
+        partial(
+            shutil.rmtree, hass.config.path(ARCHIVE_DIRECTORY, entry.entry_id), ignore_errors=True
+        )
+    )
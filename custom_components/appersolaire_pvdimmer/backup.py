@@ -0,0 +1,78 @@
+"""Fleet backup archive for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import zipfile
+from datetime import datetime
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+ARCHIVE_MANIFEST = "manifest.json"
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data in JSON (datetimes in ISO format)."""
+    return json.dumps(
+        data, indent=2, default=lambda x: x.isoformat() if isinstance(x, datetime) else x
+    ).encode("utf8")
+
+
+def write_backup_archive(path: str, backups: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    Write PV dimmers configuration backups (keyed by MAC address) in a compressed archive.
+
+    The archive contains a backup file per PV dimmer and a manifest listing them with their SHA256
+    checksum. Return the manifest.
+
+    Note: need to be run using hass.async_add_executor_job() helper since its contain I/O locking
+    calls.
+    """
+    manifest = {"version": ARCHIVE_VERSION, "time": datetime.now(), "devices": {}}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for mac_address, backup in sorted(backups.items()):
+            content = _dumps(backup)
+            filename = f"{mac_address.replace(':', '')}.json"
+            archive.writestr(filename, content)
+            manifest["devices"][mac_address] = {
+                "name": backup["data"].get("config", {}).get("dimmername"),
+                "file": filename,
+                "time": backup["time"],
+                "sha256": hashlib.sha256(content).hexdigest(),
+            }
+        archive.writestr(ARCHIVE_MANIFEST, _dumps(manifest))
+    _LOGGER.debug("%d PV dimmers configuration backup in %s", len(backups), path)
+    return manifest
+
+
+def read_backup_archive(path: str) -> dict[str, dict[str, Any]]:
+    """
+    Read PV dimmers configuration backups (keyed by MAC address) from an archive.
+
+    Raise ValueError if the archive is invalid or if a backup checksum does not match.
+
+    Note: need to be run using hass.async_add_executor_job() helper since its contain I/O locking
+    calls.
+    """
+    backups = {}
+    with zipfile.ZipFile(path) as archive:
+        try:
+            manifest = json.loads(archive.read(ARCHIVE_MANIFEST))
+        except KeyError as error:
+            raise ValueError(f"No manifest in archive {path}") from error
+        if manifest.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version {manifest.get('version')}")
+        for mac_address, device in manifest["devices"].items():
+            content = archive.read(device["file"])
+            if hashlib.sha256(content).hexdigest() != device["sha256"]:
+                raise ValueError(f"Invalid checksum of {device['file']} backup file")
+            backup = json.loads(content)
+            backup["time"] = datetime.fromisoformat(backup["time"])
+            backups[mac_address] = backup
+    return backups
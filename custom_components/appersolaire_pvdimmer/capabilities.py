@@ -0,0 +1,108 @@
+"""Firmware capabilities of APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from aiohttp import ClientResponseError
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Storage key of a config entry
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.capabilities"
+
+
+def get_firmware_signature(config: Mapping[str, Any]) -> str:
+    """Return the firmware signature computed from the configuration keys (and version if any)."""
+    content = "|".join([str(config.get("version", "")), *sorted(config)])
+    return hashlib.sha1(content.encode("utf8"), usedforsecurity=False).hexdigest()
+
+
+class CapabilityMap:
+    """
+    Map of the API endpoints (data sections) and keys supported by the PV dimmer firmware.
+
+    The map is probed once per firmware signature (each data section is requested once) and
+    persisted. Unsupported sections are never requested and entities of unsupported sections or
+    keys are not created.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the capability map."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry_id))
+        self.signature = None
+        # Data section -> set of supported keys (or None if the section is not supported)
+        self.sections = {}
+
+    async def async_load(self, signature: str) -> bool:
+        """Load persisted map and return True if it matches the firmware signature."""
+        data = await self._store.async_load()
+        if not data or data.get("signature") != signature:
+            return False
+        self.signature = signature
+        self.sections = {
+            section: set(keys) if keys is not None else None
+            for section, keys in data["sections"].items()
+        }
+        _LOGGER.debug("Capabilities loaded (firmware %s): %s", signature, self.sections)
+        return True
+
+    async def async_probe(
+        self,
+        signature: str,
+        sections: Mapping[str, str],
+        request: Callable[[str], Awaitable[Any]],
+        known: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Probe supported data sections (and their keys) and persist the map.
+
+        Sections answering with an HTTP error or an invalid content are considered as unsupported
+        (other errors, like timeouts, are raised to retry later).
+
+        :param signature: The firmware signature
+        :param sections: The data sections to probe, with their API path
+        :param request: The coroutine function used to request an API path
+        :param known: Already retrieved data sections (not requested again)
+        """
+        data = dict(known or {})
+        self.sections = {}
+        for section, path in sections.items():
+            if section not in data:
+                try:
+                    data[section] = await request(path)
+                except (ClientResponseError, ValueError) as error:
+                    _LOGGER.debug("Section %s (%s) not supported: %s", section, path, error)
+            values = data.get(section)
+            self.sections[section] = set(values) if isinstance(values, dict) else None
+        self.signature = signature
+        _LOGGER.debug("Capabilities probed (firmware %s): %s", signature, self.sections)
+        await self._store.async_save(
+            {
+                "signature": signature,
+                "sections": {
+                    section: sorted(keys) if keys is not None else None
+                    for section, keys in self.sections.items()
+                },
+            }
+        )
+
+    def supports(self, key_chain: str) -> bool:
+        """
+        Check if a data key chain (ex: "config.maxtemp") or section is supported.
+
+        Key chains of unknown sections (derived data) are considered as supported.
+        """
+        section, _, key = key_chain.partition(".")
+        if section not in self.sections:
+            return True
+        keys = self.sections[section]
+        return keys is not None and (not key or key.split(".")[0] in keys)
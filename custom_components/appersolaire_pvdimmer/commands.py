@@ -0,0 +1,123 @@
+"""Command channel for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LatestValueCommandChannel:
+    """
+    Send commands to the APPER Solaire PV Dimmer, keeping only the latest pending value.
+
+    Commands are sent one at a time and rate limited using a token bucket. Values submitted while
+    a command is waiting to be sent supersede it (and are dropped before hitting the network), so
+    the device always converges to the last requested value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[[Any], Awaitable[Any]],
+        rate: float,
+        burst: int,
+    ) -> None:
+        """Initialize the channel (rate in commands per second)."""
+        self.hass = hass
+        self.name = name
+        self._send = send
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._pending = None
+        self._in_flight = None
+        self._task = None
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def has_pending(self) -> bool:
+        """Return True if a command is waiting to be sent."""
+        return self._pending is not None
+
+    @callback
+    def submit(self, value: Any) -> asyncio.Future[bool]:
+        """
+        Submit a value to send.
+
+        Return a future resolved with True once the value is sent, or with False if it was
+        superseded by a newer value.
+        """
+        future = self.hass.loop.create_future()
+        # Mark exception as retrieved: the submitter is not required to wait for the result
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        if self._pending:
+            self.dropped += 1
+            _LOGGER.debug("%s: command %s superseded by %s", self.name, self._pending[0], value)
+            self._pending[1].set_result(False)
+        self._pending = (value, future)
+        if not self._task or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{self.name} command channel"
+            )
+        return future
+
+    async def _async_run(self) -> None:
+        """Send pending commands."""
+        while self._pending:
+            await self._async_acquire_token()
+            (value, future), self._pending = self._pending, None
+            self._in_flight = future
+            try:
+                await self._send(value)
+            except Exception as error:  # pylint: disable=broad-except
+                self.failed += 1
+                _LOGGER.warning("%s: failed to send command %s: %s", self.name, value, error)
+                future.set_exception(error)
+                continue
+            finally:
+                self._in_flight = None
+            self.sent += 1
+            future.set_result(True)
+
+    async def _async_acquire_token(self) -> None:
+        """Wait for a token of the bucket to be available and consume it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel pending command (and the one being sent, if any)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        if self._in_flight and not self._in_flight.done():
+            self._in_flight.cancel()
+        if self._pending:
+            self._pending[1].cancel()
+        self._in_flight = None
+        self._pending = None
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return channel statistics."""
+        return {
+            "commands_sent": self.sent,
+            "commands_dropped": self.dropped,
+            "commands_failed": self.failed,
+        }
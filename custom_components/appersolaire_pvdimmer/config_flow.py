@@ -2,28 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
 from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import network
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import Platform
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .const import (
+    CONF_ADAPTIVE_REFRESH,
+    CONF_CONTROLLER_KI,
+    CONF_CONTROLLER_KP,
+    CONF_CONTROLLER_PERIOD,
     CONF_DEFAULTS,
+    CONF_ENERGY_SENSORS,
+    CONF_GRID_POWER_DEADBAND,
+    CONF_GRID_POWER_ENTITY,
     CONF_HOST,
     CONF_INCLUDE_STATE_ENTITIES,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_REFRESH_RATE,
+    CONF_MIN_REFRESH_RATE,
+    CONF_MQTT_PUSH,
     CONF_REFRESH_RATE,
+    CONF_SUN_AWARE_REFRESH,
+    CONF_SURPLUS_CONTROLLER,
+    CONF_TELEMETRY_ARCHIVE,
+    CONF_TELEMETRY_STATISTICS,
+    CONF_THERMAL_MODEL,
     CONF_TIMEOUT,
+    CONF_WATCHDOG,
+    CONF_WATCHDOG_THRESHOLD,
     DOMAIN,
 )
-from .helpers import async_request
+from .helpers import async_request, async_scan_networks, get_mac_address
 
 _LOGGER = logging.getLogger(__name__)
 
+# Largest network scanned during discovery (larger ones are reduced around the HA host address)
+DISCOVERY_MIN_PREFIX = 24
+
 
 class BaseConfigFlow:
     async def async_check_user_input(self, user_input: Mapping[str, Any] | None) -> str | None:
@@ -51,15 +78,66 @@ class BaseConfigFlow:
     @staticmethod
     def _get_config_schema(defaults=None):
         """Get configuration schema"""
-        defaults = defaults or CONF_DEFAULTS
+        defaults = {**CONF_DEFAULTS, **(defaults or {})}
         return vol.Schema(
             {
                 vol.Required(CONF_HOST, default=defaults.get(CONF_HOST)): str,
                 vol.Required(
                     CONF_INCLUDE_STATE_ENTITIES, default=defaults.get(CONF_INCLUDE_STATE_ENTITIES)
                 ): bool,
+                vol.Required(CONF_MQTT_PUSH, default=defaults.get(CONF_MQTT_PUSH)): bool,
                 vol.Required(CONF_REFRESH_RATE, default=defaults.get(CONF_REFRESH_RATE)): int,
+                vol.Required(
+                    CONF_ADAPTIVE_REFRESH, default=defaults.get(CONF_ADAPTIVE_REFRESH)
+                ): bool,
+                vol.Required(
+                    CONF_MIN_REFRESH_RATE, default=defaults.get(CONF_MIN_REFRESH_RATE)
+                ): int,
+                vol.Required(
+                    CONF_MAX_REFRESH_RATE, default=defaults.get(CONF_MAX_REFRESH_RATE)
+                ): int,
+                vol.Required(
+                    CONF_SUN_AWARE_REFRESH, default=defaults.get(CONF_SUN_AWARE_REFRESH)
+                ): bool,
+                vol.Required(CONF_THERMAL_MODEL, default=defaults.get(CONF_THERMAL_MODEL)): bool,
+                vol.Required(
+                    CONF_TELEMETRY_STATISTICS, default=defaults.get(CONF_TELEMETRY_STATISTICS)
+                ): bool,
+                vol.Required(
+                    CONF_TELEMETRY_ARCHIVE, default=defaults.get(CONF_TELEMETRY_ARCHIVE)
+                ): bool,
+                vol.Required(CONF_ENERGY_SENSORS, default=defaults.get(CONF_ENERGY_SENSORS)): bool,
+                vol.Required(
+                    CONF_LONG_TERM_STATISTICS, default=defaults.get(CONF_LONG_TERM_STATISTICS)
+                ): bool,
                 vol.Required(CONF_TIMEOUT, default=defaults.get(CONF_TIMEOUT)): int,
+                vol.Optional(
+                    CONF_GRID_POWER_ENTITY,
+                    description={"suggested_value": defaults.get(CONF_GRID_POWER_ENTITY)},
+                ): selector.EntitySelector(
+                    selector.EntitySelectorConfig(
+                        domain=Platform.SENSOR, device_class=SensorDeviceClass.POWER
+                    )
+                ),
+                vol.Required(
+                    CONF_GRID_POWER_DEADBAND, default=defaults.get(CONF_GRID_POWER_DEADBAND)
+                ): int,
+                vol.Required(
+                    CONF_SURPLUS_CONTROLLER, default=defaults.get(CONF_SURPLUS_CONTROLLER)
+                ): bool,
+                vol.Required(
+                    CONF_CONTROLLER_PERIOD, default=defaults.get(CONF_CONTROLLER_PERIOD)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Required(
+                    CONF_CONTROLLER_KP, default=defaults.get(CONF_CONTROLLER_KP)
+                ): vol.Coerce(float),
+                vol.Required(
+                    CONF_CONTROLLER_KI, default=defaults.get(CONF_CONTROLLER_KI)
+                ): vol.Coerce(float),
+                vol.Required(CONF_WATCHDOG, default=defaults.get(CONF_WATCHDOG)): bool,
+                vol.Required(
+                    CONF_WATCHDOG_THRESHOLD, default=defaults.get(CONF_WATCHDOG_THRESHOLD)
+                ): int,
             }
         )
 
@@ -69,9 +147,32 @@ class ConfigFlow(BaseConfigFlow, config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize config flow."""
+        self._errors: dict[str, str] = {}
+        self._discovered: dict[str, str] = {}
+
     async def async_step_user(self, user_input: Mapping[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
-        self._errors: dict[str, str] = {}
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(self, user_input: Mapping[str, Any] | None = None) -> FlowResult:
+        """Discover PV Dimmers on the local network(s) and let user choose one."""
+        if user_input:
+            return self._async_show_manual_form({CONF_HOST: user_input[CONF_HOST]})
+
+        self._discovered = await self._async_discover()
+        if not self._discovered:
+            self._errors = {"base": "no_devices_found"}
+            return self._async_show_manual_form()
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(self._discovered)}),
+        )
+
+    async def async_step_manual(self, user_input: Mapping[str, Any] | None = None) -> FlowResult:
+        """Handle the configuration step."""
+        self._errors = {}
         if user_input:
             dimmer_name = await self.async_check_user_input(user_input)
             if dimmer_name and not self._errors:
@@ -79,10 +180,52 @@ class ConfigFlow(BaseConfigFlow, config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(title=dimmer_name, data=user_input)
 
+        return self._async_show_manual_form(user_input)
+
+    @callback
+    def _async_show_manual_form(self, defaults: Mapping[str, Any] | None = None) -> FlowResult:
+        """Show the configuration form."""
         return self.async_show_form(
-            step_id="user", data_schema=self._get_config_schema(), errors=self._errors
+            step_id="manual", data_schema=self._get_config_schema(defaults), errors=self._errors
         )
 
+    async def _async_discover(self) -> dict[str, str]:
+        """
+        Scan the local network(s) for not yet configured PV Dimmers.
+
+        Return a dict of found hosts with their label (name and MAC address).
+        """
+        networks = set()
+        for adapter in await network.async_get_adapters(self.hass):
+            if not adapter["enabled"]:
+                continue
+            for ipv4 in adapter["ipv4"]:
+                interface = ipaddress.ip_interface(
+                    f"{ipv4['address']}/{max(ipv4['network_prefix'], DISCOVERY_MIN_PREFIX)}"
+                )
+                if not interface.is_loopback and not interface.is_link_local:
+                    networks.add(interface.network)
+        _LOGGER.debug("Discover PV Dimmers on %s", ", ".join(map(str, networks)))
+        configured_hosts = {entry.data[CONF_HOST] for entry in self._async_current_entries()}
+        found = await async_scan_networks(
+            async_create_clientsession(self.hass), networks, exclude=configured_hosts
+        )
+        configured_names = self._async_current_ids()
+        found = {
+            host: config["dimmername"]
+            for host, config in found.items()
+            if config["dimmername"] not in configured_names
+        }
+        # ARP cache is filled by the scan: the lookup is quick, but locking (so run in executor)
+        mac_addresses = await asyncio.gather(
+            *(self.hass.async_add_executor_job(get_mac_address, host) for host in found)
+        )
+        _LOGGER.debug("PV Dimmers found: %s", found)
+        return {
+            host: f"{name} ({mac_address or host})"
+            for (host, name), mac_address in zip(found.items(), mac_addresses)
+        }
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -103,8 +246,11 @@ class OptionsFlow(BaseConfigFlow, config_entries.OptionsFlow):
         """Manage the options."""
         self._errors: dict[str, str] = {}
         if user_input:
-            dimmer_name = await self.async_check_user_input(user_input)
-            if dimmer_name and not self._errors:
+            # Connection is checked only if the host changed
+            if (
+                user_input[CONF_HOST] == self.config_entry.data[CONF_HOST]
+                or await self.async_check_user_input(user_input)
+            ) and not self._errors:
                 # update config entry
                 self.hass.config_entries.async_update_entry(self.config_entry, data=user_input)
                 # Finish
@@ -2,16 +2,83 @@
 
 DOMAIN = "appersolaire_pvdimmer"
 MANUFACTURER = "APPER Solaire"
+CONF_ADAPTIVE_REFRESH = "adaptive_refresh"
+CONF_CONTROLLER_KI = "controller_ki"
+CONF_CONTROLLER_KP = "controller_kp"
+CONF_CONTROLLER_PERIOD = "controller_period"
+CONF_ENERGY_SENSORS = "energy_sensors"
+CONF_GRID_POWER_DEADBAND = "grid_power_deadband"
+CONF_GRID_POWER_ENTITY = "grid_power_entity"
 CONF_HOST = "host"
 CONF_INCLUDE_STATE_ENTITIES = "include_state_entities"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_MAX_REFRESH_RATE = "max_refresh_rate"
+CONF_MIN_REFRESH_RATE = "min_refresh_rate"
+CONF_MQTT_PUSH = "mqtt_push"
 CONF_REFRESH_RATE = "refresh_rate"
+CONF_SUN_AWARE_REFRESH = "sun_aware_refresh"
+CONF_SURPLUS_CONTROLLER = "surplus_controller"
+CONF_TELEMETRY_ARCHIVE = "telemetry_archive"
+CONF_TELEMETRY_STATISTICS = "telemetry_statistics"
+CONF_THERMAL_MODEL = "thermal_model"
 CONF_TIMEOUT = "timeout"
+CONF_WATCHDOG = "watchdog"
+CONF_WATCHDOG_THRESHOLD = "watchdog_threshold"
 
 CONF_DEFAULTS = {
     CONF_INCLUDE_STATE_ENTITIES: True,
+    CONF_MQTT_PUSH: False,
     CONF_REFRESH_RATE: 60,
+    CONF_ADAPTIVE_REFRESH: False,
+    CONF_MIN_REFRESH_RATE: 10,
+    CONF_MAX_REFRESH_RATE: 900,
+    CONF_SUN_AWARE_REFRESH: True,
+    CONF_THERMAL_MODEL: False,
+    CONF_TELEMETRY_STATISTICS: False,
+    CONF_TELEMETRY_ARCHIVE: False,
+    CONF_ENERGY_SENSORS: False,
+    CONF_LONG_TERM_STATISTICS: False,
+    CONF_GRID_POWER_ENTITY: None,
+    CONF_GRID_POWER_DEADBAND: 50,
+    CONF_SURPLUS_CONTROLLER: False,
+    CONF_CONTROLLER_PERIOD: 5,
+    CONF_CONTROLLER_KP: 0.5,
+    CONF_CONTROLLER_KI: 0.05,
     CONF_TIMEOUT: 5,
+    CONF_WATCHDOG: False,
+    CONF_WATCHDOG_THRESHOLD: 100,
 }
+
+# Options changing the set of provided entities (a change requires to reload the config entry)
+ENTITY_OPTIONS = {
+    CONF_ENERGY_SENSORS,
+    CONF_INCLUDE_STATE_ENTITIES,
+    CONF_SURPLUS_CONTROLLER,
+    CONF_TELEMETRY_STATISTICS,
+    CONF_THERMAL_MODEL,
+    CONF_WATCHDOG,
+}
+
+# Number of samples kept in the in-memory telemetry buffer
+TELEMETRY_BUFFER_SIZE = 720
+
+# Minimum interval between two publications of telemetry entities states when long-term
+# statistics are imported by the integration (in seconds)
+LONG_TERM_STATISTICS_PUBLISH_INTERVAL = 300
+
+# Directories of telemetry archives, telemetry exports and fleet backup archives (in the
+# configuration directory)
+ARCHIVE_DIRECTORY = f"{DOMAIN}_archive"
+EXPORT_DIRECTORY = f"{ARCHIVE_DIRECTORY}/exports"
+BACKUP_DIRECTORY = f"{DOMAIN}_backups"
+
+# Dispatcher signal sent when a config entry coordinator is shut down (formatted with its ID)
+SIGNAL_COORDINATOR_SHUTDOWN = f"{DOMAIN}_coordinator_shutdown_{{}}"
+
+# Rate limit of POWER commands (token bucket rate in commands per second and burst size)
+POWER_COMMAND_RATE = 2.0
+POWER_COMMAND_BURST = 2
+
 TO_REDACT = {
     "password",
 }
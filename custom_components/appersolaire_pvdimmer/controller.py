@@ -0,0 +1,262 @@
+"""Surplus controller for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+from homeassistant.const import UnitOfPower
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN
+from .helpers import to_float
+
+_LOGGER = logging.getLogger(__name__)
+
+ALLOCATION_POLICY_EQUAL = "equal"
+ALLOCATION_POLICY_PRIORITY = "priority"
+
+
+@dataclass
+class Load:
+    """A load driven by a dimmer (power in W, limits in %)."""
+
+    coordinator: Any
+    power: float
+    minpow: float
+    maxpow: float
+
+    @property
+    def min_power(self) -> float:
+        """Return the minimum power of the load (in W)."""
+        return self.power * self.minpow / 100
+
+    @property
+    def max_power(self) -> float:
+        """Return the maximum power of the load (in W)."""
+        return self.power * self.maxpow / 100
+
+
+def get_load(coordinator) -> Load | None:
+    """Return the load driven by a dimmer, or None if it must not be driven."""
+    power = to_float(coordinator.get_item("config.charge1"))
+    if not power:
+        return None
+    temperature = to_float(coordinator.get_item("state.temperature"))
+    maxtemp = to_float(coordinator.get_item("config.maxtemp"))
+    if temperature is not None and maxtemp is not None and temperature >= maxtemp:
+        return Load(coordinator, power, 0.0, 0.0)
+    minpow = to_float(coordinator.get_item("config.minpow")) or 0.0
+    maxpow = to_float(coordinator.get_item("config.maxpow")) or 100.0
+    return Load(coordinator, power, minpow, max(minpow, maxpow))
+
+
+def allocate(power: float, loads: list[Load], policy: str) -> list[float]:
+    """
+    Split a power (in W) across loads and return their setpoints (in %).
+
+    With the priority policy, loads are filled up to their max power in order. With the equal
+    policy, power is equally shared across loads, the remaining of loads reaching their max power
+    being shared across others.
+    """
+    allocated = [load.min_power for load in loads]
+    remaining = power - sum(allocated)
+    if policy == ALLOCATION_POLICY_EQUAL:
+        candidates = [idx for idx, load in enumerate(loads) if load.max_power > allocated[idx]]
+        while remaining > 0 and candidates:
+            share = remaining / len(candidates)
+            for idx in candidates:
+                added = min(share, loads[idx].max_power - allocated[idx])
+                allocated[idx] += added
+                remaining -= added
+            candidates = [idx for idx in candidates if loads[idx].max_power > allocated[idx]]
+    else:
+        for idx, load in enumerate(loads):
+            added = min(max(remaining, 0), load.max_power - allocated[idx])
+            allocated[idx] += added
+            remaining -= added
+    return [round(allocated[idx] * 100 / load.power) for idx, load in enumerate(loads)]
+
+
+class SurplusController:
+    """
+    PI controller driving dimmers POWER to zero the grid export.
+
+    A controller is shared by all dimmers using the same grid power entity. On each period, the grid
+    power (positive when importing, negative when exporting) is read and the PI controller computes
+    the total power to divert. The integral term is only updated while the output is not saturated
+    (anti-windup). This power is then split across the dimmers loads in one pass, according to the
+    allocation policy, and setpoints are sent concurrently through the POWER command channel of
+    each dimmer (so commands never stack on devices).
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_id: str, period: float, kp: float, ki: float
+    ) -> None:
+        """Initialize the controller (period in seconds)."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.period = period
+        self.kp = kp
+        self.ki = ki
+        self.coordinators = []
+        self.integral = 0.0
+        # Entry ID -> last applied output, and output being sent
+        self.outputs = {}
+        self._sending = {}
+        self.policy = ALLOCATION_POLICY_PRIORITY
+        self._unsubscribe = None
+        self._last_tick = None
+        self.ticks = 0
+        self.max_jitter = 0.0
+        self.last_duration = None
+        self.max_duration = 0.0
+
+    @callback
+    def add(self, coordinator) -> None:
+        """Add a dimmer to drive (and start the control loop if needed)."""
+        if coordinator not in self.coordinators:
+            self.coordinators.append(coordinator)
+        if not self._unsubscribe:
+            _LOGGER.debug(
+                "Start surplus controller on %s (period: %ss, kp: %s, ki: %s)",
+                self.entity_id,
+                self.period,
+                self.kp,
+                self.ki,
+            )
+            self._unsubscribe = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=self.period)
+            )
+
+    @callback
+    def remove(self, coordinator) -> None:
+        """Remove a dimmer (and stop the control loop if there is no more dimmer to drive)."""
+        if coordinator in self.coordinators:
+            self.coordinators.remove(coordinator)
+        self.outputs.pop(coordinator.entry.entry_id, None)
+        self._sending.pop(coordinator.entry.entry_id, None)
+        if self.coordinators or not self._unsubscribe:
+            return
+        self._unsubscribe()
+        self._unsubscribe = None
+        self._last_tick = None
+        self.hass.data[DOMAIN]["controllers"].pop(self.entity_id, None)
+        _LOGGER.debug("Surplus controller on %s stopped", self.entity_id)
+
+    def get_grid_power(self) -> float | None:
+        """Return grid power (in W) from the configured entity."""
+        if not (state := self.hass.states.get(self.entity_id)):
+            return None
+        if (power := to_float(state.state)) is None:
+            return None
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            power *= 1000
+        return power
+
+    def compute(self, grid_power: float, loads: list[Load], elapsed: float) -> float:
+        """Compute the total power to divert (in W) from the grid power (in W)."""
+        min_power = sum(load.min_power for load in loads)
+        max_power = sum(load.max_power for load in loads)
+        error = -grid_power
+        integral = self.integral + self.ki * error * elapsed
+        output = self.kp * error + integral
+        if min_power <= output <= max_power:
+            self.integral = integral
+        else:
+            # Anti-windup: keep the integral term in the limits
+            self.integral = min(max(self.integral, min_power), max_power)
+        return min(max(output, min_power), max_power)
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Run a control loop iteration."""
+        start = time.monotonic()
+        elapsed = self.period
+        if self._last_tick is not None:
+            elapsed = start - self._last_tick
+            self.max_jitter = max(self.max_jitter, abs(elapsed - self.period))
+        self._last_tick = start
+        self.ticks += 1
+
+        if (grid_power := self.get_grid_power()) is None:
+            _LOGGER.debug("Grid power unavailable (%s), skip", self.entity_id)
+            return
+        loads = [load for coordinator in self.coordinators if (load := get_load(coordinator))]
+        # Master dimmers (with a child configured) are served first
+        loads.sort(
+            key=lambda load: (
+                not load.coordinator.get_item("config.child"),
+                load.coordinator.entry.title,
+            )
+        )
+        if not loads:
+            _LOGGER.debug("No dimmer load available, skip")
+            return
+        self.policy = (
+            ALLOCATION_POLICY_EQUAL
+            if loads[0].coordinator.get_item("config.delester") == "equal"
+            else ALLOCATION_POLICY_PRIORITY
+        )
+        power = self.compute(grid_power, loads, elapsed)
+        for load, output in zip(loads, allocate(power, loads, self.policy)):
+            entry_id = load.coordinator.entry.entry_id
+            if output != self._sending.get(entry_id, self.outputs.get(entry_id)):
+                _LOGGER.debug(
+                    "%s: grid power %sW, set POWER=%s",
+                    load.coordinator.entry.title,
+                    grid_power,
+                    output,
+                )
+                self._sending[entry_id] = output
+                load.coordinator.power_channel.submit(output).add_done_callback(
+                    partial(self._handle_sent, entry_id, output)
+                )
+
+        self.last_duration = time.monotonic() - start
+        self.max_duration = max(self.max_duration, self.last_duration)
+
+    @callback
+    def _handle_sent(self, entry_id: str, output: int, future: asyncio.Future[bool]) -> None:
+        """
+        Handle the result of a submitted output.
+
+        The output is only considered as applied once sent: on failure, it will be submitted again
+        on next period.
+        """
+        if self._sending.get(entry_id) == output:
+            self._sending.pop(entry_id)
+        if not future.cancelled() and not future.exception() and future.result():
+            self.outputs[entry_id] = output
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return control loop statistics (durations in milliseconds)."""
+        return {
+            "dimmers": len(self.coordinators),
+            "policy": self.policy,
+            "ticks": self.ticks,
+            "integral": round(self.integral, 2),
+            "max_jitter": round(self.max_jitter * 1000, 1),
+            "last_duration": (
+                round(self.last_duration * 1000, 3) if self.last_duration is not None else None
+            ),
+            "max_duration": round(self.max_duration * 1000, 3),
+        }
+
+
+@callback
+def async_get_controller(
+    hass: HomeAssistant, entity_id: str, period: float, kp: float, ki: float
+) -> SurplusController:
+    """Get (or create) the surplus controller shared by dimmers using the grid power entity."""
+    controllers = hass.data.setdefault(DOMAIN, {}).setdefault("controllers", {})
+    if entity_id not in controllers:
+        controllers[entity_id] = SurplusController(hass, entity_id, period, kp, ki)
+    return controllers[entity_id]
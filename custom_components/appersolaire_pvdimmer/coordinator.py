@@ -2,22 +2,100 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os.path
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from scapy.layers.l2 import getmacbyip
-
-from .const import CONF_DEFAULTS, CONF_HOST, CONF_REFRESH_RATE, CONF_TIMEOUT, DOMAIN
-from .helpers import async_request
+from homeassistant.util import dt as dt_util
+
+from .capabilities import CapabilityMap, get_firmware_signature
+from .commands import LatestValueCommandChannel
+from .const import (
+    ARCHIVE_DIRECTORY,
+    CONF_ADAPTIVE_REFRESH,
+    CONF_CONTROLLER_KI,
+    CONF_CONTROLLER_KP,
+    CONF_CONTROLLER_PERIOD,
+    CONF_DEFAULTS,
+    CONF_ENERGY_SENSORS,
+    CONF_GRID_POWER_DEADBAND,
+    CONF_GRID_POWER_ENTITY,
+    CONF_HOST,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_REFRESH_RATE,
+    CONF_MIN_REFRESH_RATE,
+    CONF_MQTT_PUSH,
+    CONF_REFRESH_RATE,
+    CONF_SUN_AWARE_REFRESH,
+    CONF_SURPLUS_CONTROLLER,
+    CONF_TELEMETRY_ARCHIVE,
+    CONF_TELEMETRY_STATISTICS,
+    CONF_THERMAL_MODEL,
+    CONF_TIMEOUT,
+    CONF_WATCHDOG,
+    CONF_WATCHDOG_THRESHOLD,
+    DOMAIN,
+    ENTITY_OPTIONS,
+    POWER_COMMAND_BURST,
+    POWER_COMMAND_RATE,
+    SIGNAL_COORDINATOR_SHUTDOWN,
+    TELEMETRY_BUFFER_SIZE,
+)
+from .controller import async_get_controller
+from .energy import EnergyIntegrator
+from .helpers import LatencyTracker, async_request, get_mac_address, to_float, values_match
+from .long_term_statistics import STATISTICS_METRICS, LongTermStatisticsImporter
+from .push import PVDimmerMQTTPushListener
+from .scheduler import AdaptiveRefreshScheduler
+from .telemetry import TELEMETRY_METRICS, TelemetryBuffer
+from .telemetry_archive import TelemetryArchive
+from .thermal import ThermalModel
+from .watchdog import async_get_watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+# Key chains of the temperature thresholds watched by the thermal model
+TEMPERATURE_THRESHOLDS = (
+    "config.maxtemp",
+    "dimmer_timer.temperature",
+    "relay1_timer.temperature",
+    "relay2_timer.temperature",
+)
+
+# Interval and timeout of the polling burst used to confirm a written value (in seconds)
+CONFIRM_INTERVAL = 0.25
+CONFIRM_TIMEOUT = 5.0
+
+# Minimum delay between two state refreshes triggered by grid power changes (in seconds)
+STATE_REFRESH_COOLDOWN = 1.0
+
+# Data sections always polled, even if no entity is listening to them
+ALWAYS_POLLED_SECTIONS = ("state", "config")
+
+# Data section -> API path
+SECTIONS = {
+    "state": "state",
+    "config": "config",
+    "mqtt": "getmqtt",
+    "dimmer_timer": "getminuteur?dimmer",
+    "relay1_timer": "getminuteur?relay1",
+    "relay2_timer": "getminuteur?relay2",
+}
+
+# API paths of requests that could safely be retried
+IDEMPOTENT_PATHS = set(SECTIONS.values())
+
 
 class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
     """Define an object to fetch data."""
@@ -39,66 +117,529 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
             ),
         )
         self.entry = entry
+        self._options = dict(entry.data)
         self._session = async_create_clientsession(self.hass)
-        self._backup_path = os.path.join(
-            hass.config.path(),
-            "_".join([DOMAIN, self.dimmer_mac_address.replace(":", ""), "config.json"]),
-        )
+        self.latencies = LatencyTracker()
+        self._response_cache = {}
+        self._changed_sections = None
+        self._backup_path = None
         self._last_backup = None
+        self.watchdog = async_get_watchdog(hass)
+        self.push = PVDimmerMQTTPushListener(self)
+        self.scheduler = AdaptiveRefreshScheduler(
+            self.get_option(CONF_MIN_REFRESH_RATE), self.get_option(CONF_MAX_REFRESH_RATE)
+        )
+        self.thermal_model = ThermalModel()
+        self.telemetry = TelemetryBuffer(TELEMETRY_BUFFER_SIZE)
+        self.energy = EnergyIntegrator(hass, entry.entry_id)
+        self.long_term_statistics = LongTermStatisticsImporter(
+            hass, entry.entry_id, entry.title, entry.unique_id or entry.entry_id
+        )
+        self.capabilities = CapabilityMap(hass, entry.entry_id)
+        self.platforms = []
+        self.telemetry_archive = TelemetryArchive(
+            hass, hass.config.path(ARCHIVE_DIRECTORY, entry.entry_id)
+        )
+        self._full_refresh_requested = False
+        self._state_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATE_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self.async_refresh_state,
+        )
+        self._grid_power_unsubscribe = None
+        self._grid_power_last_value = None
+        self.power_channel = LatestValueCommandChannel(
+            hass,
+            f"{entry.title} POWER",
+            self.async_set_power,
+            rate=POWER_COMMAND_RATE,
+            burst=POWER_COMMAND_BURST,
+        )
+        self.controller = None
+
+    async def _async_setup(self) -> None:
+        """Set up the coordinator (run once before the first refresh)."""
+        await self.async_update_mac_address()
+        await self._async_setup_capabilities()
+        if self.get_option(CONF_WATCHDOG):
+            self.watchdog.add(self.entry.entry_id, self.get_option(CONF_WATCHDOG_THRESHOLD) / 1000)
+        self._async_track_grid_power()
+        self._async_setup_controller()
+        if self.get_option(CONF_ENERGY_SENSORS):
+            await self.energy.async_load()
+        if self.get_option(CONF_LONG_TERM_STATISTICS):
+            await self.long_term_statistics.async_load()
+        await self.hass.async_add_executor_job(self._load_backup)
+        # Config entries are not unloaded on Home Assistant stop: append buffered telemetry samples
+        # on the final write stage
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+            )
+        )
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Append buffered telemetry samples to the archive before Home Assistant stops."""
+        await self.telemetry_archive.async_flush()
+
+    async def _async_setup_capabilities(self) -> None:
+        """Load the firmware capabilities (or probe them on a new firmware)."""
+        config = await self.async_request(SECTIONS["config"])
+        signature = get_firmware_signature(config)
+        if not await self.capabilities.async_load(signature):
+            await self.capabilities.async_probe(
+                signature, SECTIONS, self.async_request, known={"config": config}
+            )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and ignore new runs."""
+        self.watchdog.remove(self.entry.entry_id)
+        self.push.async_unsubscribe()
+        self._async_untrack_grid_power()
+        self._state_refresh_debouncer.async_shutdown()
+        if self.controller:
+            self.controller.remove(self)
+        self.power_channel.cancel()
+        if self.get_option(CONF_ENERGY_SENSORS):
+            await self.energy.async_save()
+        if self.get_option(CONF_LONG_TERM_STATISTICS):
+            await self.long_term_statistics.async_save()
+        await self.telemetry_archive.async_flush()
+        async_dispatcher_send(self.hass, SIGNAL_COORDINATOR_SHUTDOWN.format(self.entry.entry_id))
+        await super().async_shutdown()
+
+    def get_option(self, key: str) -> Any:
+        """Get configuration entry option value (or its default value)"""
+        return self.entry.data.get(key, CONF_DEFAULTS.get(key))
 
     async def async_request(self, path: str, **kwargs: Any) -> Any:
-        """Request url with method."""
-        return await async_request(
-            self._session,
-            f"http://{self.dimmer_ip}/{path}",
-            timeout=self.entry.data.get(CONF_TIMEOUT, CONF_DEFAULTS[CONF_TIMEOUT]),
-            **kwargs,
-        )
+        """
+        Request url with method.
+
+        The deadlines of each attempt and of its connection are derived from the observed latencies
+        of the path (bounded by the configured timeout) and idempotent requests are retried once.
+        """
+        timeout = self.get_option(CONF_TIMEOUT)
+        deadline = self.latencies.deadline(path, timeout)
+        start = time.monotonic()
+        try:
+            result = await async_request(
+                self._session,
+                f"http://{self.dimmer_ip}/{path}",
+                timeout=timeout,
+                attempt_timeout=deadline,
+                connect_timeout=self.latencies.connect_deadline(path, timeout),
+                retries=1 if path in IDEMPOTENT_PATHS and not kwargs else 0,
+                cache=self._response_cache if path in IDEMPOTENT_PATHS else None,
+                watchdog=self.watchdog,
+                **kwargs,
+            )
+        except TimeoutError:
+            # Widen the deadline of the path on timeout
+            self.latencies.add(path, deadline)
+            raise
+        self.latencies.add(path, time.monotonic() - start)
+        return result
 
     async def update_configuration(self, hass, entry):
-        """Update configuration"""
+        """
+        Update configuration
+
+        Only changed options are applied: a change of the provided entities reloads the config
+        entry, a host change resolves the PV Dimmer identity (MAC address and backup) again, and
+        other options are applied in place (without any request to the PV Dimmer).
+        """
+        changed = {
+            key
+            for key in {*self._options, *entry.data}
+            if self._options.get(key) != entry.data.get(key)
+        }
         self.entry = entry
+        self._options = dict(entry.data)
+        if not changed:
+            return
+        _LOGGER.debug("Options changed: %s", ", ".join(sorted(changed)))
+
+        if changed & ENTITY_OPTIONS:
+            _LOGGER.debug("Provided entities changed, reload config entry")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+
+        if CONF_HOST in changed:
+            # Refresh APPER Solaire PV Dimmer MAC address cache (and its backup)
+            await self.async_update_mac_address()
+            self._last_backup = None
+            await hass.async_add_executor_job(self._load_backup)
+            self.update_last_backup_sensor_entity_state()
+
+        if CONF_WATCHDOG_THRESHOLD in changed and self.get_option(CONF_WATCHDOG):
+            self.watchdog.add(self.entry.entry_id, self.get_option(CONF_WATCHDOG_THRESHOLD) / 1000)
+
+        if CONF_GRID_POWER_ENTITY in changed:
+            self._async_track_grid_power()
+        if changed & {
+            CONF_CONTROLLER_KI,
+            CONF_CONTROLLER_KP,
+            CONF_CONTROLLER_PERIOD,
+            CONF_GRID_POWER_ENTITY,
+        }:
+            self._async_setup_controller()
+
+        if changed & {
+            CONF_ADAPTIVE_REFRESH,
+            CONF_MAX_REFRESH_RATE,
+            CONF_MIN_REFRESH_RATE,
+            CONF_REFRESH_RATE,
+            CONF_SUN_AWARE_REFRESH,
+        }:
+            self.scheduler.min_interval = self.get_option(CONF_MIN_REFRESH_RATE)
+            self.scheduler.max_interval = self.get_option(CONF_MAX_REFRESH_RATE)
+            self.update_interval = timedelta(seconds=self.get_option(CONF_REFRESH_RATE))
+            self._update_refresh_interval()
+            _LOGGER.debug("Coordinator refresh interval updated (%s)", self.update_interval)
+            self._schedule_refresh()
+
+        if changed & {CONF_HOST, CONF_MQTT_PUSH}:
+            _LOGGER.debug("Force update")
+            await self.async_request_refresh()
+
+    async def async_get_data(self, sections: set[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Fetch data.
+
+        :param sections: The sections to fetch (default: all supported ones). Current data are kept
+                         for others.
+        """
+        data = {}
+        for section, path in SECTIONS.items():
+            if (sections is None or section in sections) and self.capabilities.supports(section):
+                data[section] = await self.async_request(path)
+        # Retrieve current data of other sections at the end since they could have been pushed
+        # during the requests
+        return {section: data.get(section, self.get_item(section)) for section in SECTIONS}
 
-        # Reset APPER Solaire PV Dimmer MAC address cache
-        self._dimmer_mac_address = None
+    @property
+    def polled_sections(self) -> set[str] | None:
+        """
+        Return data sections to poll: the always polled ones and those with listening entities.
 
-        self.update_interval = timedelta(seconds=entry.data[CONF_REFRESH_RATE])
-        _LOGGER.debug("Coordinator refresh interval updated (%s)", self.update_interval)
+        Return None (all sections) before any entity is listening.
+        """
+        contexts = set(self.async_contexts())
+        if not contexts:
+            return None
+        sections = {
+            section
+            for section in SECTIONS
+            if section in ALWAYS_POLLED_SECTIONS or section in contexts
+        }
+        if self.get_option(CONF_MQTT_PUSH):
+            # MQTT configuration is needed to handle pushed state
+            sections.add("mqtt")
+        return sections
+
+    async def async_request_refresh(self) -> None:
+        """Request a full refresh (debounced)."""
+        self._full_refresh_requested = True
+        await super().async_request_refresh()
+
+    @callback
+    def async_update_section(self, section: str, values: dict[str, Any]) -> None:
+        """Update data section keys (pushed or fetched separately) and listeners."""
+        if not self.data:
+            return
+        self.data = {**self.data, section: {**(self.data.get(section) or {}), **values}}
+        if section == "state":
+            self._process_state_sample(self.data["state"])
+        self._changed_sections = {section}
+        self.async_update_listeners()
+
+    async def async_confirm(
+        self,
+        key_chain: str,
+        expected: Any,
+        interval: float = CONFIRM_INTERVAL,
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> bool:
+        """
+        Confirm a value written on the APPER Solaire PV Dimmer.
 
-        _LOGGER.debug("Force update")
-        await self.async_refresh()
+        Poll only the data section of the key chain in a short burst until the expected value is
+        observed, and publish it right away. If it's not observed before the deadline, fall back
+        on a regular refresh.
 
-    async def async_get_data(self) -> dict[str, dict[str, Any]]:
-        """Fetch data."""
+        :param key_chain: The key chain of the written value (ex: "state.relay1")
+        :param expected: The expected value
+        """
+        section = key_chain.split(".")[0]
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                values = await self.async_request(SECTIONS[section])
+            except Exception as error:  # pylint: disable=broad-except
+                _LOGGER.debug("Failed to retrieve %s to confirm %s: %s", section, key_chain, error)
+                values = None
+            if values_match(self.get_item(key_chain, data={section: values}), expected):
+                _LOGGER.debug("%s=%s confirmed", key_chain, expected)
+                self.async_update_section(section, values)
+                return True
+            if time.monotonic() + interval > deadline:
+                break
+            await asyncio.sleep(interval)
+        _LOGGER.debug("%s=%s not confirmed after %ss, refresh data", key_chain, expected, timeout)
+        await self.async_request_refresh()
+        return False
+
+    async def async_request_state_refresh(self) -> None:
+        """Request a state refresh (debounced, so concurrent requests are coalesced)."""
+        await self._state_refresh_debouncer.async_call()
+
+    async def async_refresh_state(self) -> None:
+        """Refresh only state data."""
+        try:
+            state = await self.async_request("state")
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to refresh state: %s", error)
+            return
+        self.async_update_section("state", state)
+
+    #
+    # Grid power tracking stuff
+    #
+
+    @callback
+    def _async_track_grid_power(self) -> None:
+        """Track grid power entity changes to trigger state refreshes (if configured)."""
+        self._async_untrack_grid_power()
+        if not (entity_id := self.get_option(CONF_GRID_POWER_ENTITY)):
+            return
+        _LOGGER.debug("Track grid power entity %s", entity_id)
+        self._grid_power_unsubscribe = async_track_state_change_event(
+            self.hass, [entity_id], self._async_handle_grid_power_event
+        )
+
+    @callback
+    def _async_untrack_grid_power(self) -> None:
+        """Stop tracking grid power entity changes."""
+        if self._grid_power_unsubscribe:
+            self._grid_power_unsubscribe()
+            self._grid_power_unsubscribe = None
+        self._grid_power_last_value = None
+
+    @callback
+    def _async_handle_grid_power_event(self, event: Event[EventStateChangedData]) -> None:
+        """Trigger a debounced state refresh on significant grid power changes."""
+        if not (new_state := event.data["new_state"]):
+            return
+        if (value := to_float(new_state.state)) is None:
+            return
+        if self._grid_power_last_value is not None and abs(
+            value - self._grid_power_last_value
+        ) < self.get_option(CONF_GRID_POWER_DEADBAND):
+            return
+        self._grid_power_last_value = value
+        self.hass.async_create_task(self.async_request_state_refresh())
+
+    @callback
+    def _async_setup_controller(self) -> None:
+        """Set up (or stop) the surplus controller according to configuration."""
+        if self.controller:
+            self.controller.remove(self)
+            self.controller = None
+        if not self.get_option(CONF_SURPLUS_CONTROLLER):
+            return
+        if not (entity_id := self.get_option(CONF_GRID_POWER_ENTITY)):
+            _LOGGER.warning("Surplus controller enabled without grid power entity, ignore it")
+            return
+        # Dimmers using the same grid power entity share the controller (the options of the
+        # first set up dimmer are used)
+        self.controller = async_get_controller(
+            self.hass,
+            entity_id,
+            period=self.get_option(CONF_CONTROLLER_PERIOD),
+            kp=self.get_option(CONF_CONTROLLER_KP),
+            ki=self.get_option(CONF_CONTROLLER_KI),
+        )
+        self.controller.add(self)
+
+    @callback
+    def _process_state_sample(self, state: dict[str, Any] | None) -> None:
+        """Process a new state sample (fetched or pushed)."""
+        if not state:
+            return
+        self.scheduler.add_sample(state)
+        if self.get_option(CONF_THERMAL_MODEL):
+            self.thermal_model.add_sample(
+                time.monotonic(), to_float(state.get("temperature")), to_float(state.get("power"))
+            )
+        if self.get_option(CONF_TELEMETRY_STATISTICS):
+            self.telemetry.add_sample(
+                time.time(), {metric: to_float(state.get(metric)) for metric in TELEMETRY_METRICS}
+            )
+        if self.get_option(CONF_TELEMETRY_ARCHIVE):
+            self.telemetry_archive.add_sample(
+                time.time(), {metric: to_float(state.get(metric)) for metric in TELEMETRY_METRICS}
+            )
+        if self.get_option(CONF_LONG_TERM_STATISTICS):
+            self.long_term_statistics.add_sample(
+                dt_util.utcnow(),
+                {metric: to_float(state.get(metric)) for metric in STATISTICS_METRICS},
+            )
+        if self.get_option(CONF_ENERGY_SENSORS):
+            # Refreshes could be spaced up to the max refresh rate with adaptive refresh only
+            refresh_rate = self.get_option(CONF_REFRESH_RATE)
+            if self.get_option(CONF_ADAPTIVE_REFRESH):
+                refresh_rate = max(refresh_rate, self.get_option(CONF_MAX_REFRESH_RATE))
+            self.energy.add_sample(
+                time.monotonic(), self._get_diverted_powers(state), max_gap=2 * refresh_rate
+            )
+
+    def _get_diverted_powers(self, state: dict[str, Any]) -> dict[str, float | None]:
+        """
+        Compute diverted powers (in W) from state power percentages and load ratings.
+
+        Dimmer power is relative to the dimmer load (load 1) and total power is considered as
+        relative to the sum of all load ratings.
+        """
+        loads = [to_float(self.get_item(f"config.charge{idx}")) or 0 for idx in (1, 2, 3)]
+        power = to_float(state.get("power"))
+        total_power = to_float(state.get("Ptotal"))
         return {
-            "state": await self.async_request("state"),
-            "config": await self.async_request("config"),
-            "mqtt": await self.async_request("getmqtt"),
-            "dimmer_timer": await self.async_request("getminuteur?dimmer"),
-            "relay1_timer": await self.async_request("getminuteur?relay1"),
-            "relay2_timer": await self.async_request("getminuteur?relay2"),
+            "dimmer": power * loads[0] / 100 if power is not None else None,
+            "total": total_power * sum(loads) / 100 if total_power is not None else None,
         }
 
+    @callback
+    def _update_refresh_interval(self) -> None:
+        """Update refresh interval (using adaptive scheduler if enabled)."""
+        interval = self.get_option(CONF_REFRESH_RATE)
+        if self.get_option(CONF_ADAPTIVE_REFRESH):
+            sun_above_horizon = None
+            if self.get_option(CONF_SUN_AWARE_REFRESH) and (sun := self.hass.states.get("sun.sun")):
+                sun_above_horizon = sun.state == "above_horizon"
+            interval = self.scheduler.next_interval(
+                self.update_interval.total_seconds(), interval, sun_above_horizon
+            )
+        if self.get_option(CONF_THERMAL_MODEL):
+            # Refresh when the next temperature threshold is predicted to be crossed
+            predictions = [
+                prediction
+                for key_chain in TEMPERATURE_THRESHOLDS
+                if (threshold := to_float(self.get_item(key_chain))) is not None
+                and (prediction := self.thermal_model.time_to(threshold))
+            ]
+            if predictions:
+                interval = min(
+                    interval, max(self.get_option(CONF_MIN_REFRESH_RATE), min(predictions))
+                )
+        if interval != self.update_interval.total_seconds():
+            self.update_interval = timedelta(seconds=interval)
+            _LOGGER.debug("Coordinator refresh interval updated (%s)", self.update_interval)
+
+    @property
+    def time_to_max_temperature(self) -> float | None:
+        """Return the predicted time to reach the max temperature (in seconds)."""
+        if (maxtemp := to_float(self.get_item("config.maxtemp"))) is None:
+            return None
+        return self.thermal_model.time_to(maxtemp)
+
     async def async_set_config(self, **kwargs):
         """Set APPER Solaire PV Dimmer config keys"""
         return await self.async_request("get", params=kwargs)
 
+    async def async_apply_config(
+        self,
+        config: dict[str, Any] | None = None,
+        timers: dict[str, dict[str, Any]] | None = None,
+        save: bool = False,
+    ) -> None:
+        """
+        Apply a set of APPER Solaire PV Dimmer config keys (and timers configuration)
+
+        Config keys are set using a single request (and one request per timer), and a full refresh
+        is requested once done.
+        """
+        try:
+            if config:
+                await self.async_set_config(**config)
+            for timer, values in (timers or {}).items():
+                await self.async_request("setminuteur", params={timer: "", **values})
+            if save:
+                await self.async_save_config()
+        finally:
+            await self.async_request_refresh()
+
+    async def async_set_power(self, power: float):
+        """Set APPER Solaire PV Dimmer power (in %)"""
+        return await self.async_request("", params={"POWER": power})
+
     async def async_save_config(self):
         """Save APPER Solaire PV Dimmer configuration to its flash memory"""
         return await self.async_request("get", params={"save": "yes"})
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch data."""
-        if not self._last_backup and os.path.exists(self._backup_path):
-            await self.hass.async_add_executor_job(self._load_backup)
+        sections = self.polled_sections
+        if (
+            self.get_option(CONF_MQTT_PUSH)
+            and not self._full_refresh_requested
+            and self.push.is_fresh(2 * self.update_interval.total_seconds())
+        ):
+            # State is pushed through MQTT, fetch only configuration sections
+            sections = (sections or set(SECTIONS)) - {"state"}
+        self._full_refresh_requested = False
         try:
-            data = await self.async_get_data()
+            data = await self.async_get_data(sections)
         except Exception as error:
             _LOGGER.error(error)
             raise UpdateFailed from error
 
+        if self.get_option(CONF_MQTT_PUSH):
+            await self.push.async_subscribe(self.get_item("mqtt.topic", data=data))
+        else:
+            self.push.async_unsubscribe()
+
+        if sections is None or "state" in sections:
+            self._process_state_sample(data["state"])
+        self._update_refresh_interval()
+
+        if (
+            self.data
+            and data["config"] is not self.data.get("config")
+            and get_firmware_signature(data["config"]) != self.capabilities.signature
+        ):
+            _LOGGER.info("%s firmware changed, reload to probe its capabilities", self.entry.title)
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+
+        # Unchanged responses are returned as the same (cached) objects: only notify listeners of
+        # changed sections (and all of them on first refresh or after a failed one)
+        if self.data and self.last_update_success:
+            self._changed_sections = {
+                section for section in SECTIONS if data[section] is not self.data.get(section)
+            }
+            _LOGGER.debug("Changed sections: %s", ", ".join(sorted(self._changed_sections)))
+
         return data
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update registered listeners.
+
+        If only some data sections changed, only listeners of these sections (and of derived data)
+        are updated.
+        """
+        changed_sections, self._changed_sections = self._changed_sections, None
+        with self.watchdog.timed("coordinator listeners update"):
+            if changed_sections is None:
+                super().async_update_listeners()
+                return
+            for update_callback, context in list(self._listeners.values()):
+                if context not in SECTIONS or context in changed_sections:
+                    update_callback()
+
     def get_item(
         self, key_chain: str, default: Any = None, data: dict[str, Any] | None = None
     ) -> Any:
@@ -127,10 +668,24 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
     @property
     def dimmer_mac_address(self):
         """Get APPER Solaire PV Dimmer MAC address"""
-        if not self._dimmer_mac_address:
-            self._dimmer_mac_address = getmacbyip(self.entry.data[CONF_HOST])
         return self._dimmer_mac_address
 
+    async def async_update_mac_address(self):
+        """
+        Resolve APPER Solaire PV Dimmer MAC address and update backup path
+
+        Note: the ARP lookup is run in the executor since it's an I/O locking call.
+        """
+        self._dimmer_mac_address = await self.hass.async_add_executor_job(
+            get_mac_address, self.dimmer_ip
+        )
+        self._backup_path = os.path.join(
+            self.hass.config.path(),
+            "_".join(
+                [DOMAIN, (self._dimmer_mac_address or "unknown").replace(":", ""), "config.json"]
+            ),
+        )
+
     #
     # Backup/restore configuration stuff
     #
@@ -142,6 +697,9 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
         Note: need to be run using hass.async_add_executor_job() helper since its contain
         I/O locking calls.
         """
+        if not os.path.exists(self._backup_path):
+            _LOGGER.debug("No backup found (%s)", self._backup_path)
+            return
         _LOGGER.debug("Load last backup from %s", self._backup_path)
         try:
             with open(self._backup_path, encoding="utf8") as fd:
@@ -150,7 +708,6 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
         except (OSError, ValueError):
             _LOGGER.exception("Failed to load last backup from %s", self._backup_path)
             self._last_backup = None
-        self.update_last_backup_sensor_entity_state()
 
     def _save_backup(self, data):
         """
@@ -170,29 +727,36 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
             if os.path.exists(self._backup_path):
                 os.remove(self._backup_path)
 
-    async def async_backup_device(self):
-        """Backup PV dimmer configuration"""
-        data = {
+    async def async_get_backup(self) -> dict[str, Any]:
+        """Retrieve PV dimmer configuration backup data"""
+        return {
             "data": await self.async_get_data(),
             "time": datetime.now(),
         }
+
+    async def async_backup_device(self):
+        """Backup PV dimmer configuration"""
+        data = await self.async_get_backup()
         await self.hass.async_add_executor_job(self._save_backup, data)
         self._last_backup = data
         self.update_last_backup_sensor_entity_state()
 
     def update_last_backup_sensor_entity_state(self):
         """Update last_backup sensor entity state"""
-        for update_callback, _ in list(self._listeners.values()):
-            if "last_backup" in update_callback.__self__.unique_id:
+        for update_callback, context in list(self._listeners.values()):
+            # Entities listen with their description key as context (and other listeners, like
+            # websocket subscribers, are not entities)
+            if context == "last_backup":
                 update_callback()
 
-    async def async_restore_device(self):
-        """Restore PV dimmer configuration"""
-        assert self._last_backup, "No available backup to restore"
+    async def async_restore_device(self, backup: dict[str, Any] | None = None):
+        """Restore PV dimmer configuration (from last backup if not specified)"""
+        backup = backup or self._last_backup
+        assert backup, "No available backup to restore"
         _LOGGER.debug(
-            "Restore PV dimmer configuration from last backup (%s): %s",
-            self._last_backup["time"],
-            self._last_backup["data"],
+            "Restore PV dimmer configuration from backup (%s): %s",
+            backup["time"],
+            backup["data"],
         )
 
         restore_calls = [
@@ -274,7 +838,10 @@ class PVDimmerDataUpdateCoordinator(DataUpdateCoordinator):
         for call in restore_calls:
             params = call.get("params", {})
             for dst, src in call["data"].items():
-                value = self.get_item(src, None, self._last_backup["data"])
+                if not self.capabilities.supports(src):
+                    _LOGGER.debug("%s not supported by firmware, do not restore it", src)
+                    continue
+                value = self.get_item(src, None, backup["data"])
                 if value is not None:
                     params[dst] = value
 
@@ -21,4 +21,12 @@ async def async_get_config_entry_diagnostics(
             "options": async_redact_data(entry.options, TO_REDACT),
         },
         "data": async_redact_data(entry.runtime_data.data, TO_REDACT),
+        "latencies": entry.runtime_data.latencies.statistics,
+        "capabilities": {
+            "signature": entry.runtime_data.capabilities.signature,
+            "sections": {
+                section: sorted(keys) if keys is not None else None
+                for section, keys in entry.runtime_data.capabilities.sections.items()
+            },
+        },
     }
@@ -0,0 +1,69 @@
+"""Diverted energy integration for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Storage key of a config entry
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.energy"
+# Delay before saving energy totals after an update (in seconds)
+STORAGE_SAVE_DELAY = 60
+
+# Energy meters
+ENERGY_METERS = ("dimmer", "total")
+
+
+class EnergyIntegrator:
+    """
+    Integrate diverted power samples into persisted energy totals (in kWh).
+
+    Power is considered constant between two samples (left Riemann sum). Intervals longer than the
+    maximum gap (missed refreshes, Home Assistant restart, ...) are not integrated.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the integrator."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry_id))
+        self.totals = {meter: 0.0 for meter in ENERGY_METERS}
+        self.loaded = False
+        self._last_sample = None
+
+    async def async_load(self) -> None:
+        """Load persisted energy totals."""
+        if data := await self._store.async_load():
+            self.totals.update(data.get("totals", {}))
+            _LOGGER.debug("Energy totals loaded: %s", self.totals)
+        self.loaded = True
+
+    async def async_save(self) -> None:
+        """Save energy totals (only once loaded, to never overwrite them with initial values)."""
+        if self.loaded:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return {"totals": self.totals}
+
+    @callback
+    def add_sample(self, time: float, powers: dict[str, float | None], max_gap: float) -> None:
+        """Add a power sample (time in seconds, powers in W)."""
+        if self._last_sample and self.loaded:
+            last_time, last_powers = self._last_sample
+            elapsed = time - last_time
+            if 0 < elapsed <= max_gap:
+                for meter in ENERGY_METERS:
+                    if last_powers.get(meter):
+                        self.totals[meter] += last_powers[meter] * elapsed / 3600000
+                self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+            elif elapsed > max_gap:
+                _LOGGER.debug("Energy not integrated over a %.0fs gap", elapsed)
+        self._last_sample = (time, powers)
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEFAULTS, CONF_HOST, CONF_INCLUDE_STATE_ENTITIES, DOMAIN, MANUFACTURER
+from .const import (
+    CONF_HOST,
+    CONF_INCLUDE_STATE_ENTITIES,
+    CONF_LONG_TERM_STATISTICS,
+    DOMAIN,
+    LONG_TERM_STATISTICS_PUBLISH_INTERVAL,
+    MANUFACTURER,
+)
 from .coordinator import PVDimmerDataUpdateCoordinator
+from .helpers import to_float
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,18 +40,32 @@ class PVDimmerEntityDescription(EntityDescription):
     unique_id_key: str | None = None
     value_fn: Callable[..., StateType] | None = None
     cast_fn: Callable[..., StateType] | None = None
+    # Configuration entry option that need to be enabled to create the entity
+    option_key: str | None = None
+    # Telemetry entity (its state publication is throttled when long-term statistics are imported)
+    telemetry: bool = False
+    # State publication filtering: changes smaller than the absolute deadband or the relative
+    # deadband (ratio of the last published value) are not published, and states are published at
+    # least every max interval and at most every min interval (in seconds).
+    publish_deadband: float | None = None
+    publish_relative_deadband: float | None = None
+    publish_min_interval: float | None = None
+    publish_max_interval: float | None = None
 
 
 class PVDimmerEntity(CoordinatorEntity[PVDimmerDataUpdateCoordinator], Entity):
     """Base class for all APPER Solaire PV Dimmer entities."""
 
     _attr_has_entity_name = True
+    _last_publication = None
+    _cancel_heartbeat = None
 
     def __init__(
         self, coordinator: PVDimmerDataUpdateCoordinator, description: EntityDescription
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # Use data section as context to let the coordinator known which ones are used
+        super().__init__(coordinator, context=description.key.split(".")[0])
         self.entity_description = description
 
         self.dimmer_name = coordinator.dimmer_name
@@ -59,6 +84,88 @@ class PVDimmerEntity(CoordinatorEntity[PVDimmerDataUpdateCoordinator], Entity):
                 (device_registry.CONNECTION_NETWORK_MAC, coordinator.dimmer_mac_address)
             }
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass (its state is published)."""
+        await super().async_added_to_hass()
+        self._last_publication = (time.monotonic(), self.native_value, self.available)
+        self._async_schedule_heartbeat()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        if self._cancel_heartbeat:
+            self._cancel_heartbeat()
+            self._cancel_heartbeat = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._should_publish(time.monotonic()):
+            self._async_publish()
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Publish the current state (and schedule the next heartbeat publication)."""
+        self._last_publication = (time.monotonic(), self.native_value, self.available)
+        self._async_schedule_heartbeat()
+        with self.coordinator.watchdog.timed(f"{self.entity_id} update"):
+            super()._handle_coordinator_update()
+
+    @callback
+    def _async_schedule_heartbeat(self) -> None:
+        """
+        Schedule the publication of the state after the max interval (if any).
+
+        The heartbeat has its own timer since the coordinator does not update listeners of
+        unchanged data sections.
+        """
+        if self._cancel_heartbeat:
+            self._cancel_heartbeat()
+            self._cancel_heartbeat = None
+        if max_interval := self.entity_description.publish_max_interval:
+            self._cancel_heartbeat = async_call_later(self.hass, max_interval, self._async_publish)
+
+    def _should_publish(self, now: float) -> bool:
+        """Check if the current state have to be published (according to publication filters)."""
+        description = self.entity_description
+        min_interval = description.publish_min_interval or 0
+        if description.telemetry and self.coordinator.get_option(CONF_LONG_TERM_STATISTICS):
+            min_interval = max(min_interval, LONG_TERM_STATISTICS_PUBLISH_INTERVAL)
+        has_deadband = (
+            description.publish_deadband is not None
+            or description.publish_relative_deadband is not None
+        )
+        if self._last_publication is None or not (min_interval or has_deadband):
+            return True
+
+        last_time, last_value, last_available = self._last_publication
+        if self.available != last_available:
+            return True
+        elapsed = now - last_time
+        if (
+            description.publish_max_interval is not None
+            and elapsed >= description.publish_max_interval
+        ):
+            return True
+        if elapsed < min_interval:
+            return False
+        if not has_deadband:
+            return True
+
+        value = self.native_value
+        current, last = to_float(value), to_float(last_value)
+        if current is None or last is None:
+            return value != last_value
+        deadband = max(
+            description.publish_deadband or 0,
+            abs(last) * (description.publish_relative_deadband or 0),
+        )
+        return abs(current - last) >= deadband and current != last
+
+    async def async_confirm_value(self, expected) -> None:
+        """Confirm the value written on the APPER Solaire PV Dimmer and publish it."""
+        await self.coordinator.async_confirm(self.entity_description.key, expected)
+
     @property
     def config_key(self):
         """Return configuration key"""
@@ -88,16 +195,14 @@ async def setup_platform_entry(
 ) -> None:
     """Set up platform's entities."""
     coordinator = entry.runtime_data
-    entities = [
-        description.object_class(coordinator, description) for description in entity_descriptions
-    ]
-    if state_entity_descriptions and entry.data.get(
-        CONF_INCLUDE_STATE_ENTITIES, CONF_DEFAULTS.get(CONF_INCLUDE_STATE_ENTITIES)
-    ):
-        entities.extend(
-            [
-                description.object_class(coordinator, description)
-                for description in state_entity_descriptions
-            ]
-        )
-    async_add_entities(entities)
+    descriptions = list(entity_descriptions)
+    if state_entity_descriptions and coordinator.get_option(CONF_INCLUDE_STATE_ENTITIES):
+        descriptions.extend(state_entity_descriptions)
+    async_add_entities(
+        [
+            description.object_class(coordinator, description)
+            for description in descriptions
+            if (not description.option_key or coordinator.get_option(description.option_key))
+            and coordinator.capabilities.supports(description.key)
+        ]
+    )
@@ -1,13 +1,24 @@
 """Helpers for component."""
 
 import asyncio
+import hashlib
+import ipaddress
 import logging
+import math
+import random
+from collections import deque
+from collections.abc import Iterable
+from contextlib import nullcontext
 from typing import Any
 
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError, ClientResponse, ClientSession, ClientTimeout
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum delay before retrying a failed request (in seconds, the actual delay is random)
+RETRY_MAX_DELAY = 0.3
+
 
 async def async_request(
     session: ClientSession,
@@ -15,18 +26,197 @@ async def async_request(
     method: str = "get",
     timeout: int = 5,
     json_decode: bool = True,
+    attempt_timeout: float | None = None,
+    connect_timeout: float | None = None,
+    retries: int = 0,
+    cache: dict[str, tuple[bytes, Any]] | None = None,
+    watchdog: Any = None,
     **kwargs: Any,
 ) -> Any:
-    """Request url with method."""
+    """
+    Request url with method.
+
+    The whole request (including retries) is bounded by timeout, while each attempt and its
+    connection could be bounded by shorter deadlines. Requests failing on a connection error (or on
+    a deadline) are retried after a short random delay.
+
+    If a cache is provided, JSON responses body digests are cached with their decoded object: when
+    the body of a response is unchanged, the previously decoded object is returned as is (so its
+    identity tells that the response is unchanged).
+
+    If a loop watchdog is provided, the processing of the response on the event loop (status check
+    and decoding) is timed.
+    """
     session = session or ClientSession()
+    client_timeout = ClientTimeout(total=attempt_timeout, sock_connect=connect_timeout)
     async with asyncio.timeout(timeout):
-        _LOGGER.debug("Request: %s (%s) - %s", url, method, kwargs.get("params", "No parameter"))
-        response = await session.request(method, url, **kwargs)
-        result = (
-            await response.json(content_type=None)
-            if json_decode
-            else (await response.read()).decode("utf8")
-        )
-        _LOGGER.debug("Result (%s): %s", response.status, result)
-        response.raise_for_status()
-        return result
+        for attempt in range(retries + 1):
+            _LOGGER.debug(
+                "Request: %s (%s) - %s", url, method, kwargs.get("params", "No parameter")
+            )
+            try:
+                response = await session.request(method, url, timeout=client_timeout, **kwargs)
+                body = await response.read()
+            except (ClientConnectionError, TimeoutError) as error:
+                if attempt == retries:
+                    raise
+                _LOGGER.debug("Request %s failed (%s), retry", url, error or type(error).__name__)
+                # Jitter only spreads retries, no cryptographic randomness needed
+                await asyncio.sleep(random.uniform(0, RETRY_MAX_DELAY))  # nosec B311
+                continue
+            with watchdog.timed(f"{url} response processing") if watchdog else nullcontext():
+                return _process_response(url, response, body, json_decode, cache)
+
+
+def _process_response(
+    url: str,
+    response: ClientResponse,
+    body: bytes,
+    json_decode: bool,
+    cache: dict[str, tuple[bytes, Any]] | None,
+) -> Any:
+    """Check the status of a response and decode its body (see async_request())."""
+    response.raise_for_status()
+    if not json_decode:
+        result = body.decode("utf8")
+    elif cache is None:
+        result = decode_json(body)
+    else:
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if url in cache and cache[url][0] == digest:
+            _LOGGER.debug("Result (%s): unchanged", response.status)
+            return cache[url][1]
+        result = decode_json(body)
+        cache[url] = (digest, result)
+    _LOGGER.debug("Result (%s): %s", response.status, result)
+    return result
+
+
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON response body (None if empty)."""
+    return json_loads(body) if body.strip() else None
+
+
+class LatencyTracker:
+    """
+    Track latencies of requests per path to derive their attempt and connection deadlines.
+
+    Attempt deadlines are a multiple of the 95th percentile of the recent latencies of the path,
+    while connection deadlines (a connection takes at most a round trip of a request) are a multiple
+    of their median. Both are bounded by a minimum and the configured timeout (used until enough
+    latencies are known).
+    """
+
+    def __init__(
+        self,
+        size: int = 50,
+        min_samples: int = 10,
+        factor: float = 3.0,
+        min_timeout: float = 1.0,
+        min_connect_timeout: float = 0.5,
+    ) -> None:
+        """Initialize the tracker."""
+        self.size = size
+        self.min_samples = min_samples
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.min_connect_timeout = min_connect_timeout
+        self._latencies = {}
+
+    def add(self, path: str, latency: float) -> None:
+        """Add a request latency (in seconds)."""
+        self._latencies.setdefault(path, deque(maxlen=self.size)).append(latency)
+
+    def percentile(self, path: str, percent: float) -> float | None:
+        """Return the specified percentile (nearest rank) of latencies of a path."""
+        if not (latencies := sorted(self._latencies.get(path, ()))):
+            return None
+        return latencies[max(1, math.ceil(percent / 100 * len(latencies))) - 1]
+
+    def deadline(self, path: str, timeout: float) -> float:
+        """Return the deadline (in seconds) of a request attempt on a path."""
+        return self._deadline(path, timeout, 95, self.min_timeout)
+
+    def connect_deadline(self, path: str, timeout: float) -> float:
+        """Return the deadline (in seconds) of the connection of a request attempt on a path."""
+        return self._deadline(path, timeout, 50, self.min_connect_timeout)
+
+    def _deadline(self, path: str, timeout: float, percent: float, minimum: float) -> float:
+        """Return a multiple of a latencies percentile of a path, bounded by minimum and timeout."""
+        if len(self._latencies.get(path, ())) < self.min_samples:
+            return timeout
+        return min(timeout, max(minimum, self.factor * self.percentile(path, percent)))
+
+    @property
+    def statistics(self) -> dict[str, dict[str, float]]:
+        """Return latency percentiles per path (in milliseconds)."""
+        return {
+            path: {
+                f"p{percent}": round(self.percentile(path, percent) * 1000, 1)
+                for percent in (50, 95)
+            }
+            for path in self._latencies
+        }
+
+
+async def async_scan_networks(
+    session: ClientSession,
+    networks: Iterable[ipaddress.IPv4Network],
+    exclude: Iterable[str] = (),
+    timeout: float = 1,
+    concurrency: int = 64,
+) -> dict[str, dict[str, Any]]:
+    """
+    Scan networks for APPER Solaire PV Dimmers.
+
+    Hosts are probed on /config with a short timeout and a bounded concurrency (to not flood the
+    network). Return a dict of found hosts with their configuration.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    exclude = set(exclude)
+
+    async def async_probe(host: str) -> tuple[str, dict[str, Any] | None]:
+        async with semaphore:
+            try:
+                config = await async_request(session, f"http://{host}/config", timeout=timeout)
+            except Exception:  # pylint: disable=broad-except
+                return host, None
+        return host, config if isinstance(config, dict) and config.get("dimmername") else None
+
+    hosts = {
+        str(host) for network in networks for host in network.hosts() if str(host) not in exclude
+    }
+    _LOGGER.debug("Scan %d hosts for PV Dimmers", len(hosts))
+    results = await asyncio.gather(*(async_probe(host) for host in sorted(hosts)))
+    return {host: config for host, config in results if config}
+
+
+def get_mac_address(ip_address: str) -> str | None:
+    """
+    Resolve the MAC address of an IP address (using ARP).
+
+    Note: need to be run using hass.async_add_executor_job() helper since its contain I/O locking
+    calls (scapy is also imported on demand since it's heavy to import).
+    """
+    # pylint: disable=import-outside-toplevel
+    from scapy.layers.l2 import getmacbyip
+
+    return getmacbyip(ip_address)
+
+
+def to_float(value: Any) -> float | None:
+    """Convert a value to float (or None if not possible)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def values_match(value: Any, expected: Any) -> bool:
+    """Check if a value returned by the APPER Solaire PV Dimmer matches an expected value."""
+    if value is None:
+        return expected is None
+    float_value, float_expected = to_float(value), to_float(expected)
+    if float_value is not None and float_expected is not None:
+        return float_value == float_expected
+    return str(value) == str(expected)
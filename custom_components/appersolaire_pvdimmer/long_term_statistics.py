@@ -0,0 +1,144 @@
+"""Long-term statistics import for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# State key -> (name, unit) of the imported statistics
+STATISTICS_METRICS = {
+    "temperature": ("temperature", UnitOfTemperature.CELSIUS),
+    "power": ("power", PERCENTAGE),
+    "Ptotal": ("total power", PERCENTAGE),
+}
+
+# Period of the imported statistics (external statistics have to be aligned on hours)
+STATISTICS_PERIOD = timedelta(hours=1)
+
+STORAGE_VERSION = 1
+# Storage key of a config entry
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.statistics"
+# Delay before saving open buckets after an update (in seconds, they are also saved on Home
+# Assistant stop)
+STORAGE_SAVE_DELAY = 60
+
+
+class LongTermStatisticsImporter:
+    """
+    Aggregate telemetry samples in memory and import them as external long-term statistics.
+
+    Samples are aggregated into hourly buckets (mean, min and max) and completed buckets are
+    imported in batch through the recorder external statistics API, in place of recording each
+    sample as a state change. Open buckets are persisted (with a delay, and on Home Assistant stop)
+    and restored on load, so that a restart (or a reload) does not import statistics of a partial
+    hour.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str, object_id: str) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self.name = name
+        self.object_id = slugify(object_id)
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry_id))
+        self._buckets = {}
+        self.loaded = False
+        self.imported = 0
+
+    async def async_load(self) -> None:
+        """Restore persisted open buckets."""
+        if data := await self._store.async_load():
+            for metric, bucket in data.get("buckets", {}).items():
+                if metric in STATISTICS_METRICS and metric not in self._buckets:
+                    self._buckets[metric] = {
+                        **bucket,
+                        "start": datetime.fromisoformat(bucket["start"]),
+                    }
+            _LOGGER.debug("%s: statistics buckets restored: %s", self.name, self._buckets)
+        self.loaded = True
+
+    async def async_save(self) -> None:
+        """Persist open buckets (only once loaded, to never overwrite persisted ones)."""
+        if self.loaded:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return {
+            "buckets": {
+                metric: {**bucket, "start": bucket["start"].isoformat()}
+                for metric, bucket in self._buckets.items()
+            }
+        }
+
+    def statistic_id(self, metric: str) -> str:
+        """Return the statistic ID of a metric."""
+        return f"{DOMAIN}:{self.object_id}_{slugify(metric)}"
+
+    @callback
+    def add_sample(self, now: datetime, values: dict[str, float | None]) -> None:
+        """Add a sample to the current buckets and import completed ones."""
+        start = now.replace(minute=0, second=0, microsecond=0)
+        completed = {}
+        for metric, value in values.items():
+            if value is None or metric not in STATISTICS_METRICS:
+                continue
+            bucket = self._buckets.get(metric)
+            if bucket and bucket["start"] != start:
+                completed[metric] = bucket
+                bucket = None
+            if not bucket:
+                bucket = self._buckets[metric] = {
+                    "start": start,
+                    "min": value,
+                    "max": value,
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            bucket["min"] = min(bucket["min"], value)
+            bucket["max"] = max(bucket["max"], value)
+            bucket["sum"] += value
+            bucket["count"] += 1
+        if completed:
+            self._async_import(completed)
+        if self.loaded:
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _async_import(self, buckets: dict[str, dict]) -> None:
+        """Import completed buckets as external statistics."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        for metric, bucket in buckets.items():
+            name, unit = STATISTICS_METRICS[metric]
+            _LOGGER.debug("%s: import %s statistics: %s", self.name, metric, bucket)
+            async_add_external_statistics(
+                self.hass,
+                {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": f"{self.name} {name}",
+                    "source": DOMAIN,
+                    "statistic_id": self.statistic_id(metric),
+                    "unit_of_measurement": unit,
+                },
+                [
+                    {
+                        "start": bucket["start"],
+                        "mean": bucket["sum"] / bucket["count"],
+                        "min": bucket["min"],
+                        "max": bucket["max"],
+                    }
+                ],
+            )
+            self.imported += 1
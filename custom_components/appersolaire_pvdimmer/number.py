@@ -24,16 +24,29 @@ class PVDimmerNumberEntity(PVDimmerEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         await self.coordinator.async_set_config(**{self.config_key: int(value)})
-        await self.coordinator.async_request_refresh()
+        await self.async_confirm_value(int(value))
 
 
 class PVDimmerPowerNumberEntity(PVDimmerEntity, NumberEntity):
     """Representation of a number entity to control power."""
 
     async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        await self.coordinator.async_request("", params={"POWER": value})
-        await self.coordinator.async_request_refresh()
+        """
+        Update the current value (through the rate limited POWER command channel).
+
+        The written value is not confirmed by a polling burst (repeated slider moves would stack
+        state requests on the PV Dimmer): a single debounced state refresh is requested instead.
+        """
+        if not await self.coordinator.power_channel.submit(value):
+            _LOGGER.debug("POWER=%s superseded by a newer value", value)
+            return
+        if not self.coordinator.power_channel.has_pending:
+            await self.coordinator.async_request_state_refresh()
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra attributes."""
+        return self.coordinator.power_channel.statistics
 
 
 class PVDimmerTimerNumberEntity(PVDimmerEntity, NumberEntity):
@@ -48,7 +61,7 @@ class PVDimmerTimerNumberEntity(PVDimmerEntity, NumberEntity):
                 self.config_key: int(value),
             },
         )
-        await self.coordinator.async_request_refresh()
+        await self.async_confirm_value(int(value))
 
 
 @dataclass(frozen=True)
@@ -105,6 +118,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     # MQTT configuration entities
     PVDimmerNumberEntityDescription(
         key="mqtt.port",
+        entity_registry_enabled_default=False,
         unique_id_key="config_mqtt_port",
         name="MQTT port",
         native_step=1,
@@ -115,6 +129,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     ),
     PVDimmerNumberEntityDescription(
         key="mqtt.idxtemp",
+        entity_registry_enabled_default=False,
         unique_id_key="config_mqtt_domoticz_idx_temperature",
         name="MQTT Domoticz IDX temperature",
         native_step=1,
@@ -125,6 +140,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     ),
     PVDimmerNumberEntityDescription(
         key="mqtt.IDX",
+        entity_registry_enabled_default=False,
         unique_id_key="config_mqtt_domoticz_idx_power",
         name="MQTT Domoticz IDX power",
         native_step=1,
@@ -135,6 +151,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     ),
     PVDimmerNumberEntityDescription(
         key="mqtt.IDXAlarme",
+        entity_registry_enabled_default=False,
         unique_id_key="config_mqtt_domoticz_idx_alarm",
         name="MQTT Domoticz IDX alarm",
         native_step=1,
@@ -147,6 +164,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="dimmer_timer.temperature",
+        entity_registry_enabled_default=False,
         unique_id_key="config_dimmer_timer_temperature",
         name="Dimmer timer temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -160,6 +178,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="relay1_timer.temperature",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay1_timer_temperature",
         name="Relay 1 timer temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -173,6 +192,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="relay2_timer.temperature",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay2_timer_temperature",
         name="Relay 2 timer temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -186,6 +206,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="dimmer_timer.puissance",
+        entity_registry_enabled_default=False,
         unique_id_key="config_dimmer_timer_puissance",
         name="Dimmer timer puissance",
         native_unit_of_measurement=PERCENTAGE,
@@ -197,6 +218,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="relay1_timer.puissance",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay1_timer_puissance",
         name="Relay 1 timer puissance",
         native_unit_of_measurement=PERCENTAGE,
@@ -208,6 +230,7 @@ ENTITIES: tuple[PVDimmerNumberEntityDescription, ...] = (
     PVDimmerNumberEntityDescription(
         object_class=PVDimmerTimerNumberEntity,
         key="relay2_timer.puissance",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay2_timer_puissance",
         name="Relay 2 timer puissance",
         native_unit_of_measurement=PERCENTAGE,
@@ -0,0 +1,65 @@
+"""Timer window optimizer for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from itertools import accumulate
+
+_LOGGER = logging.getLogger(__name__)
+
+# Candidate timer powers (in %)
+POWER_LEVELS = tuple(range(10, 101, 10))
+
+
+@dataclass
+class TimerWindow:
+    """An optimized timer window (start and length in slots, power in %, cost)."""
+
+    start: int
+    length: int
+    power: int
+    cost: float
+
+
+def optimize_window(
+    energy: float,
+    load: float,
+    production: list[float],
+    tariff: list[float] | None = None,
+    slot_duration: float = 1.0,
+) -> TimerWindow | None:
+    """
+    Find the timer window and power delivering an energy at the lowest cost.
+
+    For each candidate power, the window length delivering the energy is computed and the cost of
+    each window (energy imported from the grid, weighted by its tariff) is computed in one pass
+    using prefix sums. On equal cost, the highest power (so the shortest window) and the earliest
+    window are preferred.
+
+    :param energy: The energy to deliver (in kWh)
+    :param load: The load power (in W)
+    :param production: The solar production forecast of each slot (in W)
+    :param tariff: The tariff of each slot (default: 1, so cost is the imported energy in kWh)
+    :param slot_duration: The duration of a slot (in hours)
+    :return: The best window, or None if the energy could not be delivered over the horizon
+    """
+    tariff = tariff or [1.0] * len(production)
+    best = None
+    for power in sorted(POWER_LEVELS, reverse=True):
+        slot_energy = load * power / 100 * slot_duration / 1000
+        length = math.ceil(round(energy / slot_energy, 6))
+        if not 0 < length <= len(production):
+            continue
+        costs = [
+            price * max(0.0, load * power / 100 - produced) * slot_duration / 1000
+            for produced, price in zip(production, tariff)
+        ]
+        prefix = [0.0, *accumulate(costs)]
+        for start in range(len(production) - length + 1):
+            cost = prefix[start + length] - prefix[start]
+            if best is None or cost < best.cost - 1e-9:
+                best = TimerWindow(start, length, power, cost)
+    _LOGGER.debug("Best window to deliver %skWh on a %sW load: %s", energy, load, best)
+    return best
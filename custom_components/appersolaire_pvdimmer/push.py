@@ -0,0 +1,129 @@
+"""MQTT push support for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before retrying to subscribe when the MQTT integration is not available (in seconds)
+SUBSCRIBE_RETRY_DELAY = 600
+
+# Domoticz IDX configuration key -> state key published with this IDX
+DOMOTICZ_IDX_STATE_KEYS = {
+    "IDX": "power",
+    "idxtemp": "temperature",
+    "IDXAlarme": "alerte",
+}
+
+
+def parse_state_message(
+    payload: str | bytes, mqtt_config: dict[str, Any] | None, state_keys: set[str] | None = None
+) -> dict[str, Any]:
+    """
+    Parse a message published by APPER Solaire PV Dimmer and return the state keys it provides.
+
+    Domoticz messages (`{"idx": 1, "nvalue": 0, "svalue": "42"}`) are mapped to state keys using
+    IDX values of the MQTT configuration. Other JSON objects are considered as partial states and
+    their keys matching known state keys are kept.
+    """
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        _LOGGER.debug("Ignore non-JSON MQTT message: %s", payload)
+        return {}
+    if not isinstance(message, dict):
+        return {}
+
+    if "idx" in message and "svalue" in message:
+        for idx_key, state_key in DOMOTICZ_IDX_STATE_KEYS.items():
+            idx = (mqtt_config or {}).get(idx_key)
+            if idx is not None and str(idx) == str(message["idx"]):
+                value = message["svalue"]
+                if state_key != "alerte":
+                    try:
+                        value = float(value)
+                    except (TypeError, ValueError):
+                        return {}
+                return {state_key: value}
+        return {}
+
+    return {key: value for key, value in message.items() if state_keys is None or key in state_keys}
+
+
+class PVDimmerMQTTPushListener:
+    """Subscribe to the MQTT topic on which APPER Solaire PV Dimmer publish its state."""
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the listener."""
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self.name = coordinator.entry.title
+        self._topic = None
+        self._unsubscribe = None
+        self._retry_after = None
+        self.last_message = None
+        self.messages = 0
+
+    async def async_subscribe(self, topic: str | None) -> None:
+        """
+        Subscribe to the specified topic (if not already subscribed).
+
+        If the MQTT integration is not available, subscription is not retried before a delay (so
+        refreshes are not delayed by waiting for the MQTT client each time).
+        """
+        if topic == self._topic:
+            return
+        self.async_unsubscribe()
+        if not topic or (self._retry_after and time.monotonic() < self._retry_after):
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.components import mqtt
+
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.log(
+                logging.DEBUG if self._retry_after else logging.WARNING,
+                "%s: MQTT integration is not available, push mode disabled (retry in %ss)",
+                self.name,
+                SUBSCRIBE_RETRY_DELAY,
+            )
+            self._retry_after = time.monotonic() + SUBSCRIBE_RETRY_DELAY
+            return
+        self._retry_after = None
+        self._unsubscribe = await mqtt.async_subscribe(self.hass, topic, self.async_handle_message)
+        self._topic = topic
+        _LOGGER.debug("%s: subscribed to MQTT topic %s", self.name, topic)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Unsubscribe from the current topic."""
+        if self._unsubscribe:
+            self._unsubscribe()
+            _LOGGER.debug("%s: unsubscribed from MQTT topic %s", self.name, self._topic)
+        self._unsubscribe = None
+        self._topic = None
+
+    @callback
+    def async_handle_message(self, msg) -> None:
+        """Handle a MQTT message."""
+        state = parse_state_message(
+            msg.payload,
+            self.coordinator.get_item("mqtt"),
+            set(self.coordinator.get_item("state", {})) or None,
+        )
+        if not state:
+            return
+        _LOGGER.debug("%s: state received from MQTT: %s", self.name, state)
+        self.messages += 1
+        self.last_message = time.monotonic()
+        self.coordinator.async_update_section("state", state)
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check if a state message was received in the last max_age seconds."""
+        return self.last_message is not None and time.monotonic() - self.last_message < max_age
@@ -0,0 +1,67 @@
+"""Adaptive refresh scheduling for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+from collections import deque
+from typing import Any
+
+from .helpers import to_float
+
+_LOGGER = logging.getLogger(__name__)
+
+# Variances of recent samples above which the dimmer is considered as actively modulating
+POWER_VARIANCE_THRESHOLD = 1.0
+TEMPERATURE_VARIANCE_THRESHOLD = 0.05
+
+
+class AdaptiveRefreshScheduler:
+    """
+    Compute the refresh interval from recent state samples.
+
+    While the dimmer is actively modulating (power is not null or recent power/temperature samples
+    vary), the minimum interval is used. Otherwise, the interval is doubled on each refresh up to
+    the maximum interval. If the sun is known to be above the horizon, the interval is also capped
+    to the default refresh interval to keep a good responsiveness when solar surplus is expected.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, window: int = 10) -> None:
+        """Initialize the scheduler (intervals in seconds)."""
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._power = deque(maxlen=window)
+        self._temperature = deque(maxlen=window)
+
+    def add_sample(self, state: dict[str, Any]) -> None:
+        """Add a state sample."""
+        power = to_float(state.get("power"))
+        total_power = to_float(state.get("Ptotal"))
+        if power is not None or total_power is not None:
+            self._power.append(max(power or 0, total_power or 0))
+        temperature = to_float(state.get("temperature"))
+        if temperature is not None:
+            self._temperature.append(temperature)
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the dimmer seems to be actively modulating."""
+        if self._power and self._power[-1] > 0:
+            return True
+        if len(self._power) > 1 and statistics.pvariance(self._power) > POWER_VARIANCE_THRESHOLD:
+            return True
+        return (
+            len(self._temperature) > 1
+            and statistics.pvariance(self._temperature) > TEMPERATURE_VARIANCE_THRESHOLD
+        )
+
+    def next_interval(
+        self, current: float, default: float, sun_above_horizon: bool | None = None
+    ) -> float:
+        """Compute next refresh interval (in seconds)."""
+        if self.is_active:
+            return self.min_interval
+        interval = min(self.max_interval, max(self.min_interval, current * 2))
+        if sun_above_horizon:
+            interval = min(interval, max(self.min_interval, default))
+        return interval
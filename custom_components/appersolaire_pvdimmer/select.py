@@ -36,7 +36,7 @@ class PVDimmerSelectEntity(PVDimmerEntity, SelectEntity):
             list(self.entity_description.options_labels.values()).index(value)
         ]
         await self.coordinator.async_set_config(**{self.config_key: real_value})
-        await self.coordinator.async_request_refresh()
+        await self.async_confirm_value(real_value)
 
 
 @dataclass(frozen=True)
@@ -12,15 +12,31 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import (
+    CONF_ENERGY_SENSORS,
+    CONF_SURPLUS_CONTROLLER,
+    CONF_TELEMETRY_STATISTICS,
+    CONF_THERMAL_MODEL,
+    CONF_WATCHDOG,
+)
 from .coordinator import PVDimmerDataUpdateCoordinator
 from .entity import PVDimmerEntity, PVDimmerEntityDescription, setup_platform_entry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum interval between two publications of telemetry sensors states (in seconds)
+TELEMETRY_HEARTBEAT_INTERVAL = 600
+
 
 class PVDimmerSensorEntity(PVDimmerEntity, SensorEntity):
     """Representation of a sensor entity."""
@@ -33,7 +49,148 @@ class PVDimmerSensorEntityDescription(PVDimmerEntityDescription, SensorEntityDes
     object_class = PVDimmerSensorEntity
 
 
-ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = ()
+class LoopLagSensorEntity(PVDimmerSensorEntity):
+    """Representation of the event loop lag sensor entity."""
+
+    @property
+    def native_value(self):
+        """Return maximum event loop lag (in milliseconds)."""
+        max_lag = self.coordinator.watchdog.max_lag
+        return round(max_lag * 1000, 1) if max_lag is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra attributes."""
+        last_lag = self.coordinator.watchdog.last_lag
+        return {
+            "last_lag": round(last_lag * 1000, 1) if last_lag is not None else None,
+            "blocked_loops": self.coordinator.watchdog.blocked_loops,
+            "slow_sections": self.coordinator.watchdog.slow_sections,
+        }
+
+
+class TelemetryStatisticsSensorEntity(PVDimmerSensorEntity):
+    """Representation of a telemetry statistics sensor entity (state is the rolling mean)."""
+
+    @property
+    def native_value(self):
+        """Return rolling mean of the metric."""
+        return self.coordinator.telemetry.statistics(self.config_key)["mean"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra attributes."""
+        return {
+            **self.coordinator.telemetry.statistics(self.config_key),
+            "since": self.coordinator.telemetry.since,
+        }
+
+
+class SurplusControllerSensorEntity(PVDimmerSensorEntity):
+    """Representation of the surplus controller output sensor entity."""
+
+    @property
+    def native_value(self):
+        """Return last surplus controller output."""
+        if not self.coordinator.controller:
+            return None
+        return self.coordinator.controller.outputs.get(self.coordinator.entry.entry_id)
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra attributes (control loop statistics)."""
+        return self.coordinator.controller.statistics if self.coordinator.controller else None
+
+
+ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = (
+    PVDimmerSensorEntityDescription(
+        object_class=LoopLagSensorEntity,
+        key="max_loop_lag",
+        name="Max event loop lag",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        option_key=CONF_WATCHDOG,
+    ),
+    PVDimmerSensorEntityDescription(
+        object_class=SurplusControllerSensorEntity,
+        key="surplus_controller_output",
+        name="Surplus controller output",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        icon="mdi:tune-vertical",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        option_key=CONF_SURPLUS_CONTROLLER,
+    ),
+    PVDimmerSensorEntityDescription(
+        key="time_to_max_temperature",
+        name="Time to max temperature",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:thermometer-chevron-up",
+        value_fn=lambda self: self.coordinator.time_to_max_temperature,
+        cast_fn=lambda x: round(x / 60, 1),
+        option_key=CONF_THERMAL_MODEL,
+    ),
+    PVDimmerSensorEntityDescription(
+        object_class=TelemetryStatisticsSensorEntity,
+        key="statistics.temperature",
+        unique_id_key="temperature_statistics",
+        name="Temperature statistics",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        icon="mdi:chart-bell-curve",
+        state_class=SensorStateClass.MEASUREMENT,
+        option_key=CONF_TELEMETRY_STATISTICS,
+    ),
+    PVDimmerSensorEntityDescription(
+        object_class=TelemetryStatisticsSensorEntity,
+        key="statistics.power",
+        unique_id_key="power_statistics",
+        name="Power statistics",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        icon="mdi:chart-bell-curve",
+        state_class=SensorStateClass.MEASUREMENT,
+        option_key=CONF_TELEMETRY_STATISTICS,
+    ),
+    PVDimmerSensorEntityDescription(
+        object_class=TelemetryStatisticsSensorEntity,
+        key="statistics.Ptotal",
+        unique_id_key="total_power_statistics",
+        name="Total power statistics",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        icon="mdi:chart-bell-curve",
+        state_class=SensorStateClass.MEASUREMENT,
+        option_key=CONF_TELEMETRY_STATISTICS,
+    ),
+    PVDimmerSensorEntityDescription(
+        key="energy.dimmer",
+        unique_id_key="diverted_energy",
+        name="Diverted energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:water-boiler",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda self: round(self.coordinator.energy.totals["dimmer"], 4),
+        option_key=CONF_ENERGY_SENSORS,
+    ),
+    PVDimmerSensorEntityDescription(
+        key="energy.total",
+        unique_id_key="total_diverted_energy",
+        name="Total diverted energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:lightning-bolt",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda self: round(self.coordinator.energy.totals["total"], 4),
+        option_key=CONF_ENERGY_SENSORS,
+    ),
+)
 
 STATE_ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = (
     PVDimmerSensorEntityDescription(
@@ -45,6 +202,9 @@ STATE_ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = (
         icon="mdi:thermometer",
         state_class=SensorStateClass.MEASUREMENT,
         cast_fn=float,
+        telemetry=True,
+        publish_deadband=0.2,
+        publish_max_interval=TELEMETRY_HEARTBEAT_INTERVAL,
     ),
     PVDimmerSensorEntityDescription(
         key="state.power",
@@ -55,6 +215,9 @@ STATE_ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = (
         icon="mdi:percent",
         state_class=SensorStateClass.MEASUREMENT,
         cast_fn=float,
+        telemetry=True,
+        publish_deadband=1,
+        publish_max_interval=TELEMETRY_HEARTBEAT_INTERVAL,
     ),
     PVDimmerSensorEntityDescription(
         key="state.Ptotal",
@@ -65,6 +228,9 @@ STATE_ENTITIES: tuple[PVDimmerSensorEntityDescription, ...] = (
         icon="mdi:percent",
         state_class=SensorStateClass.MEASUREMENT,
         cast_fn=float,
+        telemetry=True,
+        publish_deadband=1,
+        publish_max_interval=TELEMETRY_HEARTBEAT_INTERVAL,
     ),
     PVDimmerSensorEntityDescription(
         key="state.alerte",
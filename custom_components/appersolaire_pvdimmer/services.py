@@ -0,0 +1,351 @@
+"""Services for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .backup import read_backup_archive, write_backup_archive
+from .const import BACKUP_DIRECTORY, CONF_TELEMETRY_ARCHIVE, DOMAIN, EXPORT_DIRECTORY
+from .coordinator import SECTIONS
+from .helpers import to_float, values_match
+from .optimizer import optimize_window
+from .telemetry import TELEMETRY_METRICS
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_BACKUP_ALL = "backup_all"
+SERVICE_EXPORT_TELEMETRY = "export_telemetry"
+SERVICE_GET_STATISTICS = "get_statistics"
+SERVICE_OPTIMIZE_TIMER = "optimize_timer"
+SERVICE_RESTORE_ALL = "restore_all"
+SERVICE_SET_CONFIG = "set_config"
+
+# Maximum number of PV dimmers requested concurrently by fleet services
+SERVICE_CONCURRENCY = 8
+
+# Timer -> key chain of its load power
+TIMERS = {
+    "dimmer": "config.charge1",
+    "relay1": "config.charge2",
+    "relay2": "config.charge3",
+}
+
+SET_CONFIG_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("config", default={}): {cv.string: vol.Any(str, int, float)},
+        vol.Optional("timers", default={}): {vol.In(TIMERS): {cv.string: vol.Any(str, int, float)}},
+        vol.Optional("save", default=False): cv.boolean,
+    }
+)
+
+BACKUP_ALL_SCHEMA = cv.make_entity_service_schema({vol.Optional("path"): cv.string})
+
+
+def _check_forecasts_length(data: dict[str, Any]) -> dict[str, Any]:
+    """Check that forecasts have the same length."""
+    if len(data.get("tariff", data["production"])) != len(data["production"]):
+        raise vol.Invalid("tariff and production forecasts must have the same length")
+    return data
+
+
+OPTIMIZE_TIMER_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional("timer", default="dimmer"): vol.In(TIMERS),
+            vol.Required("energy"): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
+            vol.Required("production"): [vol.Coerce(float)],
+            vol.Optional("tariff"): [vol.Coerce(float)],
+            vol.Optional("start"): cv.datetime,
+            vol.Optional("slot_duration", default=60): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional("temperature"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional("dry_run", default=False): cv.boolean,
+        }
+    ),
+    _check_forecasts_length,
+)
+
+EXPORT_TELEMETRY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("path"): cv.string,
+    }
+)
+
+RESTORE_ALL_SCHEMA = cv.make_entity_service_schema({vol.Required("path"): cv.string})
+
+
+async def async_get_target_entries(hass: HomeAssistant, call: ServiceCall) -> list[ConfigEntry]:
+    """Return loaded config entries targeted by a service call (all if no target is specified)."""
+    entry_ids = await async_extract_config_entry_ids(hass, call)
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED and (not entry_ids or entry.entry_id in entry_ids)
+    ]
+
+
+async def async_get_statistics(call: ServiceCall) -> ServiceResponse:
+    """Return rolling statistics of telemetry metrics of targeted PV dimmers."""
+    return {
+        entry.title: {
+            "since": entry.runtime_data.telemetry.since,
+            **{
+                metric: entry.runtime_data.telemetry.statistics(metric)
+                for metric in TELEMETRY_METRICS
+            },
+        }
+        for entry in await async_get_target_entries(call.hass, call)
+    }
+
+
+async def async_run_on_entries(
+    entries: list[ConfigEntry],
+    action: Callable[[ConfigEntry], Awaitable[dict[str, Any] | None]],
+    title: str,
+) -> list[dict[str, Any]]:
+    """
+    Run an action on PV dimmers concurrently (with a global concurrency cap).
+
+    Return the result of each action with its success, error message and duration (in
+    milliseconds).
+    """
+    semaphore = asyncio.Semaphore(SERVICE_CONCURRENCY)
+
+    async def async_run(entry: ConfigEntry) -> dict[str, Any]:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                result = {"success": True, **(await action(entry) or {})}
+            except Exception as error:  # pylint: disable=broad-except
+                _LOGGER.warning("%s: failed to %s: %s", entry.title, title, error)
+                result = {"success": False, "error": str(error) or type(error).__name__}
+            result["duration"] = round((time.monotonic() - start) * 1000)
+            return result
+
+    return await asyncio.gather(*(async_run(entry) for entry in entries))
+
+
+def get_archive_path(hass: HomeAssistant, path: str, directory: str) -> str:
+    """
+    Return the absolute path of an archive, or of a directory of archives (relative to the
+    configuration directory).
+
+    Paths outside the specified integration directory must be allowed by the
+    allowlist_external_dirs configuration.
+    """
+    path = hass.config.path(path)
+    if not (
+        Path(path).resolve().is_relative_to(Path(hass.config.path(directory)).resolve())
+        or hass.config.is_allowed_path(path)
+    ):
+        raise ServiceValidationError(
+            f"Access to {path} is not allowed (add its directory to allowlist_external_dirs)"
+        )
+    return path
+
+
+async def async_set_config(call: ServiceCall) -> ServiceResponse:
+    """Apply config keys (and timers configuration) on targeted PV dimmers concurrently."""
+
+    async def async_apply(entry: ConfigEntry) -> None:
+        await entry.runtime_data.async_apply_config(
+            call.data["config"], call.data["timers"], call.data["save"]
+        )
+
+    entries = await async_get_target_entries(call.hass, call)
+    results = await async_run_on_entries(entries, async_apply, "apply configuration")
+    return {entry.title: result for entry, result in zip(entries, results)}
+
+
+async def async_backup_all(call: ServiceCall) -> ServiceResponse:
+    """Backup targeted PV dimmers configuration concurrently in a single archive."""
+    path = get_archive_path(
+        call.hass,
+        call.data.get("path")
+        or os.path.join(
+            BACKUP_DIRECTORY, f"{DOMAIN}_backup_{dt_util.now().strftime('%Y%m%d%H%M%S')}.zip"
+        ),
+        BACKUP_DIRECTORY,
+    )
+    backups = {}
+
+    async def async_backup(entry: ConfigEntry) -> dict[str, Any]:
+        if not (mac_address := entry.runtime_data.dimmer_mac_address):
+            raise ValueError("unknown MAC address")
+        backups[mac_address] = await entry.runtime_data.async_get_backup()
+        return {"mac_address": mac_address}
+
+    entries = await async_get_target_entries(call.hass, call)
+    results = await async_run_on_entries(entries, async_backup, "backup configuration")
+    if backups:
+        await call.hass.async_add_executor_job(write_backup_archive, path, backups)
+    return {
+        "path": path if backups else None,
+        "devices": {entry.title: result for entry, result in zip(entries, results)},
+    }
+
+
+async def async_restore_all(call: ServiceCall) -> ServiceResponse:
+    """Restore targeted PV dimmers configuration concurrently from an archive."""
+    path = get_archive_path(call.hass, call.data["path"], BACKUP_DIRECTORY)
+    try:
+        backups = await call.hass.async_add_executor_job(read_backup_archive, path)
+    except Exception as error:
+        raise ServiceValidationError(f"Invalid archive {path}: {error}") from error
+
+    async def async_restore(entry: ConfigEntry) -> dict[str, Any]:
+        mac_address = entry.runtime_data.dimmer_mac_address
+        if mac_address not in backups:
+            raise ValueError(f"no backup of {mac_address or 'unknown MAC address'} in archive")
+        await entry.runtime_data.async_restore_device(backups[mac_address])
+        await entry.runtime_data.async_request_refresh()
+        return {
+            "mac_address": mac_address,
+            "backup_time": backups[mac_address]["time"].isoformat(),
+        }
+
+    entries = await async_get_target_entries(call.hass, call)
+    results = await async_run_on_entries(entries, async_restore, "restore configuration")
+    return {entry.title: result for entry, result in zip(entries, results)}
+
+
+async def async_export_telemetry(call: ServiceCall) -> ServiceResponse:
+    """Export archived telemetry of targeted PV dimmers in a time range as CSV files."""
+    start = dt_util.as_local(call.data["start"])
+    end = dt_util.as_local(call.data.get("end") or dt_util.now())
+    directory = get_archive_path(
+        call.hass, call.data.get("path") or EXPORT_DIRECTORY, EXPORT_DIRECTORY
+    )
+
+    async def async_export(entry: ConfigEntry) -> dict[str, Any]:
+        coordinator = entry.runtime_data
+        if not coordinator.get_option(CONF_TELEMETRY_ARCHIVE):
+            raise ValueError("telemetry archive not enabled")
+        path = os.path.join(
+            directory,
+            f"{DOMAIN}_{slugify(entry.title)}_{start:%Y%m%d%H%M%S}_{end:%Y%m%d%H%M%S}.csv",
+        )
+        await coordinator.telemetry_archive.async_flush()
+        samples = await call.hass.async_add_executor_job(
+            coordinator.telemetry_archive.export_csv, path, start, end
+        )
+        return {"path": path, "samples": samples}
+
+    entries = await async_get_target_entries(call.hass, call)
+    results = await async_run_on_entries(entries, async_export, "export telemetry")
+    return {entry.title: result for entry, result in zip(entries, results)}
+
+
+async def async_optimize_timer(call: ServiceCall) -> ServiceResponse:
+    """
+    Program a timer of targeted PV dimmers on the window delivering an energy at the lowest cost.
+
+    Only the timer fields differing from the current configuration (fetched from the PV dimmer,
+    as polled data could be outdated) are written.
+    """
+    timer = call.data["timer"]
+    slot_duration = timedelta(minutes=call.data["slot_duration"])
+    start = dt_util.as_local(
+        call.data.get("start") or dt_util.now().replace(minute=0, second=0, microsecond=0)
+    )
+
+    async def async_optimize(entry: ConfigEntry) -> dict[str, Any]:
+        coordinator = entry.runtime_data
+        data = {
+            section: await coordinator.async_request(SECTIONS[section])
+            for section in ("config", f"{timer}_timer")
+        }
+        if not (load := to_float(coordinator.get_item(TIMERS[timer], data=data))):
+            raise ValueError(f"unknown {timer} load power")
+        window = optimize_window(
+            call.data["energy"],
+            load,
+            call.data["production"],
+            call.data.get("tariff"),
+            slot_duration.total_seconds() / 3600,
+        )
+        if not window:
+            raise ValueError("energy could not be delivered over the forecast horizon")
+        values = {
+            "heure_demarrage": f"{start + window.start * slot_duration:%H:%M}",
+            "heure_arret": f"{start + (window.start + window.length) * slot_duration:%H:%M}",
+            "puissance": window.power,
+        }
+        if "temperature" in call.data:
+            values["temperature"] = call.data["temperature"]
+        changed = {
+            key: value
+            for key, value in values.items()
+            if not values_match(coordinator.get_item(f"{timer}_timer.{key}", data=data), value)
+        }
+        if changed and not call.data["dry_run"]:
+            await coordinator.async_apply_config(timers={timer: changed})
+        return {**values, "cost": round(window.cost, 3), "changed": list(changed)}
+
+    entries = await async_get_target_entries(call.hass, call)
+    results = await async_run_on_entries(entries, async_optimize, "optimize timer")
+    return {entry.title: result for entry, result in zip(entries, results)}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATISTICS,
+        async_get_statistics,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKUP_ALL,
+        async_backup_all,
+        schema=BACKUP_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_TELEMETRY,
+        async_export_telemetry,
+        schema=EXPORT_TELEMETRY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OPTIMIZE_TIMER,
+        async_optimize_timer,
+        schema=OPTIMIZE_TIMER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_ALL,
+        async_restore_all,
+        schema=RESTORE_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CONFIG,
+        async_set_config,
+        schema=SET_CONFIG_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -1,6 +1,5 @@
 """Button for APPER Solaire PV Dimmer router."""
 
-import asyncio
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -31,14 +30,8 @@ class PVDimmerSwitchEntity(PVDimmerEntity, SwitchEntity):
             self.entity_description.set_request_path,
             params=self.entity_description.set_request_compute_args(self, state),
         )
-        if self.entity_description.waiting_delay_after_toggle:
-            _LOGGER.debug(
-                "Request sent, we need to wait a bit (%ds) before updating state...",
-                self.entity_description.waiting_delay_after_toggle,
-            )
-            await asyncio.sleep(self.entity_description.waiting_delay_after_toggle)
-        _LOGGER.debug("Updating state")
-        await self.coordinator.async_request_refresh()
+        _LOGGER.debug("Request sent, confirming state")
+        await self.async_confirm_value(int(state))
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
@@ -59,7 +52,6 @@ class PVDimmerSwitchEntityDescription(PVDimmerEntityDescription, SwitchEntityDes
     set_request_compute_args: Callable[[PVDimmerSwitchEntity, bool], None] = lambda self, state: {
         self.config_key: int(state)
     }  # noqa: E731
-    waiting_delay_after_toggle: int | None = None
 
     icon = ("mdi:toggle-switch-variant-off",)
     device_class = SwitchDeviceClass.SWITCH
@@ -0,0 +1,95 @@
+"""In-memory telemetry buffer for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+from array import array
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# State keys stored in the telemetry buffer
+TELEMETRY_METRICS = ("power", "Ptotal", "temperature")
+
+# Percentiles computed on telemetry metrics
+TELEMETRY_PERCENTILES = (5, 50, 95)
+
+
+class RollingMetric:
+    """
+    Fixed-size ring buffer of a metric with incrementally maintained statistics.
+
+    Values are stored in an array, a sorted copy of the window is maintained by insertion (for
+    min, max and percentiles) and the sum is updated on each sample (for mean).
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the ring buffer."""
+        self.size = size
+        self._values = array("d", [math.nan]) * size
+        self._sorted = []
+        self._sum = 0.0
+
+    def set(self, index: int, value: float | None) -> None:
+        """Store value at the specified index of the ring buffer (replacing the previous one)."""
+        previous = self._values[index]
+        if not math.isnan(previous):
+            del self._sorted[bisect.bisect_left(self._sorted, previous)]
+            self._sum -= previous
+        value = math.nan if value is None else float(value)
+        self._values[index] = value
+        if not math.isnan(value):
+            bisect.insort(self._sorted, value)
+            self._sum += value
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the specified percentile (nearest rank) of the window."""
+        if not self._sorted:
+            return None
+        rank = max(1, math.ceil(percent / 100 * len(self._sorted)))
+        return self._sorted[rank - 1]
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return statistics of the window."""
+        count = len(self._sorted)
+        return {
+            "count": count,
+            "min": self._sorted[0] if count else None,
+            "max": self._sorted[-1] if count else None,
+            "mean": round(self._sum / count, 3) if count else None,
+            **{f"p{percent}": self.percentile(percent) for percent in TELEMETRY_PERCENTILES},
+        }
+
+
+class TelemetryBuffer:
+    """Fixed-size buffer of timestamped telemetry samples."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer."""
+        self.size = size
+        self._times = array("d", [math.nan]) * size
+        self._metrics = {metric: RollingMetric(size) for metric in TELEMETRY_METRICS}
+        self._index = 0
+        self.count = 0
+
+    def add_sample(self, timestamp: float, values: dict[str, float | None]) -> None:
+        """Add a sample (timestamp in seconds since epoch)."""
+        self._times[self._index] = timestamp
+        for metric, rolling_metric in self._metrics.items():
+            rolling_metric.set(self._index, values.get(metric))
+        self._index = (self._index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    @property
+    def since(self) -> float | None:
+        """Return the timestamp of the oldest sample in the buffer."""
+        if not self.count:
+            return None
+        return self._times[self._index if self.count == self.size else 0]
+
+    def statistics(self, metric: str) -> dict[str, Any]:
+        """Return statistics of the specified metric."""
+        return self._metrics[metric].statistics
@@ -0,0 +1,163 @@
+"""On-disk telemetry archive for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import csv
+import logging
+import math
+import mmap
+import os
+from array import array
+from collections.abc import Iterator
+from contextlib import ExitStack
+from datetime import UTC, date, datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+
+from .telemetry import TELEMETRY_METRICS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of samples buffered in memory before being appended to the archive
+ARCHIVE_BATCH_SIZE = 60
+
+# Column file of samples timestamps (uint32 seconds since epoch)
+TIME_COLUMN = "time"
+
+
+def _column_path(directory: str, day: date, column: str) -> str:
+    """Return the path of a column file of a day."""
+    return os.path.join(directory, day.isoformat(), f"{column}.bin")
+
+
+class TelemetryArchive:
+    """
+    Append-only columnar archive of telemetry samples.
+
+    Samples are stored in a directory per day (UTC), with a fixed-width file per column:
+    timestamps as uint32 (seconds since epoch) and metrics as float32 (NaN when unknown), in the
+    host byte order, so a sample of a metric takes 4 bytes. Samples are buffered in memory and
+    appended in batches in the executor. Range reads memory-map the column files and locate the
+    range by bisection on the timestamps column.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.directory = directory
+        self._buffer = []
+        self._lock = asyncio.Lock()
+
+    @callback
+    def add_sample(self, timestamp: float, values: dict[str, float | None]) -> None:
+        """Add a sample (timestamp in seconds since epoch) and append buffered ones if needed."""
+        self._buffer.append((int(timestamp), values))
+        if len(self._buffer) >= ARCHIVE_BATCH_SIZE:
+            self.hass.async_create_background_task(self.async_flush(), "telemetry archive flush")
+
+    async def async_flush(self) -> None:
+        """Append buffered samples to the archive."""
+        async with self._lock:
+            samples, self._buffer = self._buffer, []
+            if samples:
+                await self.hass.async_add_executor_job(self._append, samples)
+
+    def _append(self, samples: list[tuple[int, dict[str, float | None]]]) -> None:
+        """
+        Append samples to the archive.
+
+        Note: need to be run using hass.async_add_executor_job() helper since its contain I/O
+        locking calls.
+        """
+        days = {}
+        for timestamp, values in samples:
+            days.setdefault(datetime.fromtimestamp(timestamp, UTC).date(), []).append(
+                (timestamp, values)
+            )
+        for day, day_samples in days.items():
+            os.makedirs(
+                os.path.dirname(_column_path(self.directory, day, TIME_COLUMN)), exist_ok=True
+            )
+            columns = {TIME_COLUMN: array("I", (timestamp for timestamp, _ in day_samples))}
+            for metric in TELEMETRY_METRICS:
+                columns[metric] = array(
+                    "f",
+                    (
+                        math.nan if values.get(metric) is None else values[metric]
+                        for _, values in day_samples
+                    ),
+                )
+            # Metrics columns are written before timestamps: readers rely on the timestamps column
+            # length
+            for column in (*TELEMETRY_METRICS, TIME_COLUMN):
+                with open(_column_path(self.directory, day, column), "ab") as fd:
+                    columns[column].tofile(fd)
+        _LOGGER.debug("%d samples appended to telemetry archive %s", len(samples), self.directory)
+
+    def read_range(self, start: datetime, end: datetime) -> Iterator[tuple[int, ...]]:
+        """
+        Iterate over archived samples in a time range (timestamp and metrics values).
+
+        Note: need to be run in the executor since its contain I/O locking calls.
+        """
+        start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+        day = datetime.fromtimestamp(start_ts, UTC).date()
+        while day <= datetime.fromtimestamp(end_ts, UTC).date():
+            if os.path.exists(_column_path(self.directory, day, TIME_COLUMN)):
+                yield from self._read_day(day, start_ts, end_ts)
+            day += timedelta(days=1)
+
+    def _read_day(self, day: date, start_ts: int, end_ts: int) -> Iterator[tuple[int, ...]]:
+        """Iterate over archived samples of a day in a time range."""
+        with ExitStack() as stack:
+            views = {}
+            for column in (TIME_COLUMN, *TELEMETRY_METRICS):
+                fd = stack.enter_context(open(_column_path(self.directory, day, column), "rb"))
+                if not (size := os.fstat(fd.fileno()).st_size // 4):
+                    continue
+                map_ = stack.enter_context(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ))
+                view = stack.enter_context(memoryview(map_))
+                views[column] = stack.enter_context(
+                    view[: size * 4].cast("I" if column == TIME_COLUMN else "f")
+                )
+            if TIME_COLUMN not in views:
+                return
+            times = views[TIME_COLUMN]
+            for idx in range(
+                bisect.bisect_left(times, start_ts), bisect.bisect_right(times, end_ts)
+            ):
+                yield (
+                    times[idx],
+                    *(
+                        (
+                            views[metric][idx]
+                            if metric in views and idx < len(views[metric])
+                            else math.nan
+                        )
+                        for metric in TELEMETRY_METRICS
+                    ),
+                )
+
+    def export_csv(self, path: str, start: datetime, end: datetime) -> int:
+        """
+        Export archived samples in a time range as CSV and return the number of exported samples.
+
+        Note: need to be run using hass.async_add_executor_job() helper since its contain I/O
+        locking calls.
+        """
+        count = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf8", newline="") as fd:
+            writer = csv.writer(fd)
+            writer.writerow(("time", *TELEMETRY_METRICS))
+            for timestamp, *values in self.read_range(start, end):
+                writer.writerow(
+                    (
+                        datetime.fromtimestamp(timestamp, UTC).isoformat(),
+                        *("" if math.isnan(value) else round(value, 3) for value in values),
+                    )
+                )
+                count += 1
+        return count
@@ -22,7 +22,7 @@ class PVDimmerTextEntity(PVDimmerEntity, TextEntity):
     async def async_set_value(self, value: str) -> None:
         """Update the current value."""
         await self.coordinator.async_set_config(**{self.config_key: value})
-        await self.coordinator.async_request_refresh()
+        await self.async_confirm_value(value)
 
 
 @dataclass(frozen=True)
@@ -65,6 +65,7 @@ ENTITIES: tuple[PVDimmerTextEntityDescription, ...] = (
     ),
     PVDimmerTextEntityDescription(
         key="mqtt.server",
+        entity_registry_enabled_default=False,
         config_key="hostname",
         unique_id_key="config_mqtt_server",
         name="MQTT Server",
@@ -72,6 +73,7 @@ ENTITIES: tuple[PVDimmerTextEntityDescription, ...] = (
     ),
     PVDimmerTextEntityDescription(
         key="mqtt.user",
+        entity_registry_enabled_default=False,
         config_key="mqttuser",
         unique_id_key="config_mqtt_user",
         name="MQTT user",
@@ -79,6 +81,7 @@ ENTITIES: tuple[PVDimmerTextEntityDescription, ...] = (
     ),
     PVDimmerTextEntityDescription(
         key="mqtt.password",
+        entity_registry_enabled_default=False,
         config_key="mqttpassword",
         unique_id_key="config_mqtt_password",
         name="MQTT password",
@@ -87,6 +90,7 @@ ENTITIES: tuple[PVDimmerTextEntityDescription, ...] = (
     ),
     PVDimmerTextEntityDescription(
         key="mqtt.topic",
+        entity_registry_enabled_default=False,
         config_key="Publish",
         unique_id_key="config_mqtt_domoticz_topic",
         name="MQTT Domoticz topic",
@@ -0,0 +1,70 @@
+"""Water tank thermal model for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+from collections import deque
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum number of temperature variation rates needed to fit the model
+MIN_RATES = 3
+
+
+class ThermalModel:
+    """
+    Lightweight thermal model of the water tank heated by the dimmer.
+
+    The temperature variation rate is considered as linear with the dimmer power
+    (`dT/dt = a * power + b`, with `b` representing the tank losses) and the coefficients are
+    fitted by linear regression over a rolling window of (time, temperature, power) samples.
+    """
+
+    def __init__(self, window: int = 30) -> None:
+        """Initialize the model."""
+        self._samples = deque(maxlen=window)
+
+    def add_sample(self, time: float, temperature: float | None, power: float | None) -> None:
+        """Add a sample (time in seconds)."""
+        if temperature is None:
+            return
+        if self._samples and time <= self._samples[-1][0]:
+            return
+        self._samples.append((time, temperature, power or 0.0))
+
+    def fit(self) -> tuple[float, float] | None:
+        """Fit the model and return its coefficients (a, b), or None if not enough samples."""
+        powers = []
+        rates = []
+        for (t1, temp1, power), (t2, temp2, _) in zip(self._samples, list(self._samples)[1:]):
+            powers.append(power)
+            rates.append((temp2 - temp1) / (t2 - t1))
+        if len(rates) < MIN_RATES:
+            return None
+        if len(set(powers)) == 1:
+            # Constant power: only the mean rate could be estimated
+            return 0.0, statistics.fmean(rates)
+        return statistics.linear_regression(powers, rates)
+
+    @property
+    def temperature(self) -> float | None:
+        """Return last temperature sample."""
+        return self._samples[-1][1] if self._samples else None
+
+    def predicted_rate(self) -> float | None:
+        """Return the predicted temperature variation rate at current power (in °C/s)."""
+        if not (coefficients := self.fit()):
+            return None
+        return coefficients[0] * self._samples[-1][2] + coefficients[1]
+
+    def time_to(self, threshold: float) -> float | None:
+        """Return the predicted time to reach the specified temperature (in seconds)."""
+        if (temperature := self.temperature) is None:
+            return None
+        if temperature >= threshold:
+            return 0.0
+        rate = self.predicted_rate()
+        if not rate or rate <= 0:
+            return None
+        return (threshold - temperature) / rate
@@ -39,7 +39,7 @@ class PVDimmerTimeEntity(PVDimmerEntity, TimeEntity):
                 self.config_key: value.strftime("%H:%M"),
             },
         )
-        await self.coordinator.async_request_refresh()
+        await self.async_confirm_value(value.strftime("%H:%M"))
 
 
 @dataclass(frozen=True)
@@ -53,36 +53,42 @@ ENTITIES: tuple[PVDimmerTimeEntityDescription, ...] = (
     # Timers configuration entities
     PVDimmerTimeEntityDescription(
         key="dimmer_timer.heure_demarrage",
+        entity_registry_enabled_default=False,
         unique_id_key="config_dimmer_timer_start_hour",
         name="Dimmer timer start hour",
         icon="mdi:hours-24",
     ),
     PVDimmerTimeEntityDescription(
         key="dimmer_timer.heure_arret",
+        entity_registry_enabled_default=False,
         unique_id_key="config_dimmer_timer_stop_hour",
         name="Dimmer timer stop hour",
         icon="mdi:hours-24",
     ),
     PVDimmerTimeEntityDescription(
         key="relay1_timer.heure_demarrage",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay1_timer_start_hour",
         name="Relay 1 timer start hour",
         icon="mdi:hours-24",
     ),
     PVDimmerTimeEntityDescription(
         key="relay1_timer.heure_arret",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay1_timer_stop_hour",
         name="Relay 1 timer stop hour",
         icon="mdi:hours-24",
     ),
     PVDimmerTimeEntityDescription(
         key="relay2_timer.heure_demarrage",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay2_timer_start_hour",
         name="Relay 2 timer start hour",
         icon="mdi:hours-24",
     ),
     PVDimmerTimeEntityDescription(
         key="relay2_timer.heure_arret",
+        entity_registry_enabled_default=False,
         unique_id_key="config_relay2_timer_stop_hour",
         name="Relay 2 timer stop hour",
         icon="mdi:hours-24",
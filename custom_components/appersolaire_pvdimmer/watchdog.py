@@ -0,0 +1,169 @@
+"""Event loop watchdog for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LoopWatchdog:
+    """
+    Detect event loop lag and blocking calls in integration code paths.
+
+    A heartbeat is scheduled on the event loop every `interval` seconds and its delay is recorded
+    as the loop lag. A monitor thread checks the heartbeat: if the loop does not tick within the
+    threshold, the stack of the event loop thread is captured and logged, so that the blocking
+    call is identified while it is still running.
+
+    The event loop is shared, so a single watchdog is used by all config entries enabling it: it
+    runs while at least one of them uses it, with the lowest of their thresholds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        threshold: float = 0.1,
+        interval: float = 0.5,
+        window: int = 120,
+    ) -> None:
+        """Initialize the watchdog (threshold and interval in seconds)."""
+        self.hass = hass
+        self.name = name
+        self.threshold = threshold
+        self.interval = interval
+        self.enabled = False
+        # Config entry ID -> threshold (in seconds) of config entries using the watchdog
+        self._users = {}
+        self.slow_sections = 0
+        self.blocked_loops = 0
+        self._lags = deque(maxlen=window)
+        self._expected = None
+        self._handle = None
+        self._loop_thread_id = None
+        self._reported = None
+        self._stop = None
+        self._thread = None
+
+    @callback
+    def add(self, entry_id: str, threshold: float) -> None:
+        """Use the watchdog for a config entry (and start it if needed)."""
+        self._users[entry_id] = threshold
+        self.threshold = min(self._users.values())
+        self.start()
+
+    @callback
+    def remove(self, entry_id: str) -> None:
+        """Stop using the watchdog for a config entry (and stop it if it's no more used)."""
+        if self._users.pop(entry_id, None) is None:
+            return
+        if self._users:
+            self.threshold = min(self._users.values())
+        else:
+            self.stop()
+
+    def start(self) -> None:
+        """Start watching the event loop (must be called from the event loop)."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._loop_thread_id = threading.get_ident()
+        self._expected = time.monotonic() + self.interval
+        self._handle = self.hass.loop.call_later(self.interval, self._beat)
+        # Each monitor thread has its own stop event, so a thread of a previous run could not be
+        # resumed by a fast restart
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._monitor, args=(self._stop,), name=f"{self.name} loop watchdog", daemon=True
+        )
+        self._thread.start()
+        _LOGGER.debug("%s: loop watchdog started (threshold: %.3fs)", self.name, self.threshold)
+
+    def stop(self) -> None:
+        """Stop watching the event loop."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+        self._stop = None
+        self._thread = None
+        _LOGGER.debug("%s: loop watchdog stopped", self.name)
+
+    def _beat(self) -> None:
+        """Record the loop lag and schedule the next heartbeat."""
+        now = time.monotonic()
+        self._lags.append(max(0.0, now - self._expected))
+        self._expected = now + self.interval
+        if self.enabled:
+            self._handle = self.hass.loop.call_later(self.interval, self._beat)
+
+    def _monitor(self, stop: threading.Event) -> None:
+        """Capture the event loop thread stack when the heartbeat is late (run in a thread)."""
+        while not stop.wait(self.threshold / 2):
+            expected = self._expected
+            late = time.monotonic() - expected
+            if late < self.threshold or self._reported == expected:
+                continue
+            self._reported = expected
+            self.blocked_loops += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            _LOGGER.warning(
+                "%s: event loop blocked for more than %.3fs, current stack:\n%s",
+                self.name,
+                late,
+                "".join(traceback.format_stack(frame)) if frame else "unavailable",
+            )
+
+    @contextmanager
+    def timed(self, section: str):
+        """Time a synchronous section and report it with its stack if it exceeds the threshold."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if duration >= self.threshold:
+                self.slow_sections += 1
+                _LOGGER.warning(
+                    "%s: %s took %.3fs on the event loop:\n%s",
+                    self.name,
+                    section,
+                    duration,
+                    "".join(traceback.format_stack()[:-2]),
+                )
+
+    @property
+    def max_lag(self) -> float | None:
+        """Return the maximum loop lag observed over the window (in seconds)."""
+        return max(self._lags) if self._lags else None
+
+    @property
+    def last_lag(self) -> float | None:
+        """Return the last observed loop lag (in seconds)."""
+        return self._lags[-1] if self._lags else None
+
+
+@callback
+def async_get_watchdog(hass: HomeAssistant) -> LoopWatchdog:
+    """Get (or create) the event loop watchdog shared by config entries."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if "watchdog" not in data:
+        data["watchdog"] = LoopWatchdog(hass, "APPER Solaire PV Dimmer")
+    return data["watchdog"]
@@ -0,0 +1,161 @@
+"""Websocket API for APPER Solaire PV Dimmer."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, SIGNAL_COORDINATOR_SHUTDOWN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StateSubscriber:
+    """
+    Stream state deltas of a PV dimmer to a websocket subscriber.
+
+    Only state keys changed since the last message are sent. With a throttle, changes are coalesced
+    and sent at most once per throttle period. When the config entry is unloaded (or reloaded), an
+    "unloaded" message is sent and the stream of this PV dimmer ends (the client has to subscribe
+    again).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        entry_id: str,
+        coordinator,
+        throttle: float,
+    ) -> None:
+        """Initialize the subscriber."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entry_id = entry_id
+        self.coordinator = coordinator
+        self.throttle = throttle
+        self._last_state = {}
+        self._last_sent = None
+        self._cancel_flush = None
+        self._remove_listener = None
+        self._remove_shutdown_listener = None
+
+    @callback
+    def async_start(self) -> None:
+        """Send the state snapshot and start listening to state updates."""
+        self._last_state = dict(self.coordinator.get_item("state") or {})
+        self._send({"snapshot": self._last_state})
+        self._remove_listener = self.coordinator.async_add_listener(
+            self._async_handle_update, context="state"
+        )
+        self._remove_shutdown_listener = async_dispatcher_connect(
+            self.hass,
+            SIGNAL_COORDINATOR_SHUTDOWN.format(self.entry_id),
+            self._async_handle_shutdown,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening to state updates."""
+        if self._remove_listener:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._remove_shutdown_listener:
+            self._remove_shutdown_listener()
+            self._remove_shutdown_listener = None
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+
+    @callback
+    def _async_handle_shutdown(self) -> None:
+        """Handle the coordinator shutdown (config entry unloaded)."""
+        self.async_stop()
+        self._send({"unloaded": True})
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a state update (sending the delta or scheduling it)."""
+        if self._cancel_flush:
+            return
+        if self.throttle and self._last_sent is not None:
+            remaining = self._last_sent + self.throttle - time.monotonic()
+            if remaining > 0:
+                self._cancel_flush = async_call_later(self.hass, remaining, self._async_flush)
+                return
+        self._async_flush()
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Send the state delta (if any)."""
+        self._cancel_flush = None
+        state = self.coordinator.get_item("state") or {}
+        delta = {key: value for key, value in state.items() if self._last_state.get(key) != value}
+        if not delta:
+            return
+        self._last_state = {**self._last_state, **delta}
+        self._send({"delta": delta})
+
+    @callback
+    def _send(self, data: dict[str, Any]) -> None:
+        """Send an event message."""
+        self._last_sent = time.monotonic()
+        self.connection.send_message(
+            websocket_api.event_message(self.msg_id, {"entry_id": self.entry_id, **data})
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_ids"): [str],
+        vol.Optional("throttle", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to state deltas of PV dimmers (all loaded ones if not specified)."""
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+        and ("entry_ids" not in msg or entry.entry_id in msg["entry_ids"])
+    ]
+    if "entry_ids" in msg and len(entries) != len(msg["entry_ids"]):
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "PV Dimmer not found")
+        return
+
+    subscribers = [
+        StateSubscriber(
+            hass, connection, msg["id"], entry.entry_id, entry.runtime_data, msg["throttle"]
+        )
+        for entry in entries
+    ]
+
+    @callback
+    def async_unsubscribe() -> None:
+        for subscriber in subscribers:
+            subscriber.async_stop()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    for subscriber in subscribers:
+        subscriber.async_start()
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Set up integration websocket API."""
+    websocket_api.async_register_command(hass, websocket_subscribe)